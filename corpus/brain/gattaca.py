@@ -78,6 +78,11 @@ MODELS = {
     9: "gemini-3-flash-preview",  # CHAT (Agentic with Tools)
 }
 
+# Output budget for tweet-sized answers (max_tokens=...). Gemini 3 counts
+# thinking tokens against max_output_tokens: ~80 would cut the text itself,
+# so this caps runaway output rather than the tweet length.
+TWEET_MAX_TOKENS = 2048
+
 # API Keys (FREE + quota) for routes 2-8
 
 
@@ -130,6 +135,10 @@ class GattacaRouter:
             route_id: Route to use (1-6)
             **kwargs: Optional params:
                 - response_schema: Pydantic model or dict for structured output
+                - max_tokens: Output token budget (incl. thinking)
+                - stop: List of stop sequences
+                  (both honored by API routes only: ROUTE_PRO's CLI ignores them
+                  and applies them only when it falls back to FLASH)
         """
         if not self.active_routes.get(route_id):
             logger.warning(f"🚫 Route {route_id} blocked, falling back to FLASH")
@@ -416,12 +425,19 @@ class GattacaRouter:
     async def _route_text(self, prompt: str, model: str, **kwargs) -> str:
         """
         Text generation with API key + Cloud 2 fallback.
-        Supports optional response_schema for structured JSON output.
+        Supports optional response_schema for structured JSON output,
+        max_tokens and stop sequences.
         """
         # Build generation config
         config = {}
         response_schema = kwargs.get("response_schema")
 
+        # SOTA 2026: Let the model stop early instead of trimming client-side
+        if kwargs.get("max_tokens"):
+            config["max_output_tokens"] = kwargs["max_tokens"]
+        if kwargs.get("stop"):
+            config["stop_sequences"] = kwargs["stop"]
+
         if response_schema:
             # Structured output mode
             config["response_mime_type"] = "application/json"
@@ -13,15 +13,40 @@ import shutil
 import asyncio
 import aiofiles
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Optional, Union
 from loguru import logger
 from corpus.dna.genome import MEMORIES_DIR
 
+try:
+    import orjson  # Rust-backed: several times faster than stdlib json
+except ImportError:
+    orjson = None
 
-def save_json(path: Union[str, Path], data: Any, indent: int = 4):
+_ORJSON_OPTS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson else 0
+
+
+def dumps(data: Any, indent: int = 4) -> bytes:
+    """
+    Sérialise en JSON (UTF-8).
+    orjson si disponible, sinon json stdlib.
+    Avec orjson: `indent` est booléen (tout indent non nul -> 2 espaces,
+    0 -> compact) et NaN/Infinity sont écrits `null` (JSON strict).
+    """
+    if orjson:
+        try:
+            opts = _ORJSON_OPTS | (orjson.OPT_INDENT_2 if indent else 0)
+            return orjson.dumps(data, default=str, option=opts)
+        except TypeError:
+            pass  # e.g. int > 64 bits: stdlib handles it
+    return json.dumps(data, indent=indent or None, default=str).encode("utf-8")
+
+
+def save_json(path: Union[str, Path], data: Any, indent: int = 4) -> bool:
     """
     Saves Atomique de JSON.
     Écrit dans un fichier temporaire (LAB/ATAOMIC_BUFFER) puis déplace.
+    `indent`: voir dumps() (2 espaces ou compact quand orjson est installé).
+    Retourne False si l'écriture a échoué (erreur déjà loggée).
     """
     path = Path(path)
     buffer_dir = MEMORIES_DIR / "buffer"
@@ -30,19 +55,21 @@ def save_json(path: Union[str, Path], data: Any, indent: int = 4):
 
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(tmp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=indent, default=str)
+        with open(tmp_path, "wb") as f:
+            f.write(dumps(data, indent))
             f.flush()
             os.fsync(f.fileno())  # Force write to disk
 
         # Atomic Rename
         shutil.move(str(tmp_path), str(path))
         logger.debug(f"💾 [CELLS] Saved: {path.name}")
+        return True
 
     except Exception as e:
         logger.error(f"💥 [CELLS] Write Failed {path}: {e}")
         if tmp_path.exists():
             tmp_path.unlink()
+        return False
 
 
 async def save_json_async(path: Union[str, Path], data: Any, indent: int = 4):
@@ -61,9 +88,9 @@ async def save_json_async(path: Union[str, Path], data: Any, indent: int = 4):
         path.parent.mkdir(parents=True, exist_ok=True)
 
         # Async write with aiofiles
-        async with aiofiles.open(tmp_path, "w", encoding="utf-8") as f:
+        async with aiofiles.open(tmp_path, "wb") as f:
             # Offload serialization to thread to avoid blocking loop with large data
-            content = await asyncio.to_thread(json.dumps, data, indent=indent, default=str)
+            content = await asyncio.to_thread(dumps, data, indent)
             await f.write(content)
             await f.flush()
             # Force write to disk (blocking op run in thread)
@@ -83,6 +110,21 @@ async def save_json_async(path: Union[str, Path], data: Any, indent: int = 4):
                 pass
 
 
+def file_stamp(path: Union[str, Path]) -> Optional[tuple]:
+    """
+    Identité du fichier sur disque (st_ino, st_mtime_ns, st_size), None si absent.
+    Détecteur de changement best-effort: un stamp différent = fichier modifié
+    (les saves atomiques changent l'inode). L'inverse n'est pas garanti: une
+    écriture en place de même taille dans la résolution du mtime, ou un inode
+    recyclé, peut laisser le stamp identique.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
 def load_json(path: Union[str, Path], default: Any = None) -> Any:
     """Charge un JSON de manière tolérante."""
     path = Path(path)
@@ -93,9 +135,17 @@ def load_json(path: Union[str, Path], default: Any = None) -> Any:
         return {}
 
     try:
+        if orjson:
+            raw = path.read_bytes()
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # Files written by stdlib json may hold NaN/Infinity (rejected
+                # by orjson): only a stdlib failure means the file is corrupt.
+                return json.loads(raw)
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
-    except json.JSONDecodeError as e:
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses it
         logger.error(f"💥 [CELLS] Corrupted JSON {path}: {e}")
         return default if default is not None else {}
     except Exception as e:
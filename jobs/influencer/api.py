@@ -7,8 +7,10 @@ ARCHI: SOTA 2026 (Uses Core Config & Sovereign Modules)
 ══════════════════════════════════════════════════════════════════════════════
 """
 
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Union
+import hashlib
 import time
 from pathlib import Path
 
@@ -16,7 +18,7 @@ from fastapi import APIRouter, HTTPException, BackgroundTasks
 from loguru import logger
 from pydantic import BaseModel
 
-from corpus.soma.cells import load_json
+from corpus.soma.cells import file_stamp, load_json
 from corpus.dna.genome import MEMORIES_DIR
 
 # Core Imports
@@ -24,6 +26,7 @@ from jobs.influencer.core.config import config_manager
 from jobs.influencer.core.approval_queue import approval_queue
 from jobs.influencer.core.x_client import x_client
 from jobs.influencer.core.rules import SpamFilter, Priorities
+from social.messaging.notification_client import notify
 
 # Modules State Access (Direct read for status)
 # We read state files directly for performance to avoid waking up modules if not needed
@@ -34,6 +37,15 @@ ORCHESTRATOR_STATE = (
 MENTIONS_STATE = DATA_DIR / "mentions.json"
 GROK_STATE = DATA_DIR / "grok_banter.json"  # Storage uses grok_banter.json
 YOUTUBE_STATE = DATA_DIR / "youtube_state.json"
+MENTIONS_FEED = DATA_DIR / "mentions_feed.json"
+
+# Last parsed mentions feed, keyed by file stamp (ino, mtime_ns, size).
+# The worker replaces the file atomically, so a stamp change = new snapshot.
+_FEED_CACHE: tuple = (None, None)
+
+# Recently sent viral dedup keys (LRU) - skips re-notifying the same milestone
+_VIRAL_SENT: "OrderedDict[str, None]" = OrderedDict()
+_VIRAL_SENT_MAX = 256
 
 
 # =============================================================================
@@ -157,6 +169,13 @@ def _safe_timestamp(val: Union[str, float, int, None]) -> float:
         return 0.0
 
 
+def _iso_timestamp(val: Union[str, float, int, None]) -> Optional[str]:
+    """Display form (ISO) of a stored timestamp (epoch seconds or legacy ISO)."""
+    if isinstance(val, (float, int)):
+        return datetime.fromtimestamp(val).isoformat()
+    return val
+
+
 # =============================================================================
 # ENDPOINTS
 # =============================================================================
@@ -362,12 +381,13 @@ async def get_influencer_status():
                 "spam_words_count": len(SpamFilter.get_keywords()),
             },
             # Priority accounts
-            "priorities": Priorities.get_all(),
+            "priorities": list(Priorities.get_all()),
             # Spam Keywords (New)
             "spam_keywords": SpamFilter.get_keywords(),
             "recent_activity": activity_log,
             "pending_tweets": [
-                {**v, "id": k} for k, v in queue_state.get("pending", {}).items()
+                {**v, "id": k, "created_at": _iso_timestamp(v.get("created_at"))}
+                for k, v in queue_state.get("pending", {}).items()
             ],
         }
     except Exception as e:
@@ -522,7 +542,7 @@ async def update_priorities(payload: Dict[str, list]):
         if not isinstance(priorities, list):
             raise HTTPException(status_code=400, detail="Priorities must be a list")
 
-        Priorities.save(priorities)
+        await Priorities.save_async(priorities)
         logger.info(f"📋 Priorities updated: {len(priorities)} accounts")
         return {"status": "ok", "count": len(priorities)}
     except Exception as e:
@@ -538,7 +558,7 @@ async def update_spam_words(keywords: Dict[str, list]):
         if not isinstance(words, list):
             raise HTTPException(status_code=400, detail="Keywords must be a list")
 
-        SpamFilter.save(words)
+        await SpamFilter.save_async(words)
         logger.info(f"🚫 Spam keywords updated: {len(words)} words")
         return {"status": "ok", "count": len(words)}
     except Exception as e:
@@ -718,11 +738,14 @@ async def get_influencer_logs(lines: int = 50):
 @router.get("/mentions")
 async def get_recent_mentions():
     """Fetch recent mentions from persisted feed."""
+    global _FEED_CACHE
     try:
-        feed_file = DATA_DIR / "mentions_feed.json"
-        if not feed_file.exists():
+        stamp = file_stamp(MENTIONS_FEED)
+        if stamp is None:
             return {"mentions": []}
-        return load_json(feed_file)
+        if _FEED_CACHE[0] != stamp:
+            _FEED_CACHE = (stamp, load_json(MENTIONS_FEED))
+        return _FEED_CACHE[1]
     except Exception as e:
         logger.error(f"Failed to load mentions: {e}")
         return {"mentions": []}
@@ -856,12 +879,10 @@ async def _refresh_x_metrics_background():
                         dirty = True
                 if real.get("created_at"):
                     try:
-                        # Normalize time
-                        dt = datetime.fromisoformat(
-                            real["created_at"].replace("Z", "+00:00")
-                        )
-                        if abs(item.get("posted_at", 0) - dt.timestamp()) > 60:
-                            item["posted_at"] = dt.timestamp()
+                        # Normalize time (epoch seconds, or legacy ISO string)
+                        ts = _safe_timestamp(real["created_at"])
+                        if ts and abs(item.get("posted_at", 0) - ts) > 60:
+                            item["posted_at"] = ts
                             dirty = True
                     except Exception:
                         pass
@@ -952,9 +973,17 @@ async def _refresh_x_metrics_background():
             for m in fresh_metrics:
                 likes = int(m.get("likes", 0) or 0)
                 if likes >= 100:
+                    # Per-tweet key, bucketed per 100 likes (new milestone = new alert)
+                    dedup_key = (
+                        "VIRAL:"
+                        + hashlib.sha256(
+                            f"{m.get('id')}|{likes // 100 * 100}".encode()
+                        ).hexdigest()[:16]
+                    )
+                    if dedup_key in _VIRAL_SENT:
+                        _VIRAL_SENT.move_to_end(dedup_key)
+                        continue
                     try:
-                        from social.messaging.notification_client import notify
-
                         # SOTA 2026: Intelligent truncation (Standard 362.102)
                         tweet_text = m.get("text", "")
                         preview = (
@@ -965,8 +994,11 @@ async def _refresh_x_metrics_background():
                         ellipsis = "..." if len(tweet_text) > 100 else ""
                         await notify.influencer(
                             f"🔥 Tweet Viral!\n{likes} ❤️ sur: {preview}{ellipsis}",
-                            dedup_key="INFLUENCER_VIRAL",
+                            dedup_key=dedup_key,
                         )
+                        _VIRAL_SENT[dedup_key] = None
+                        if len(_VIRAL_SENT) > _VIRAL_SENT_MAX:
+                            _VIRAL_SENT.popitem(last=False)
                         break  # One notification per refresh to avoid spam
                     except Exception:
                         pass
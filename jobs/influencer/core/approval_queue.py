@@ -10,34 +10,51 @@ FLOW:
 ══════════════════════════════════════════════════════════════════════════════
 """
 
+import time
 import uuid
 from datetime import datetime
 from typing import Dict, Optional
 
-from corpus.soma.cells import load_json, save_json
+from corpus.soma.cells import file_stamp, load_json, save_json
 from corpus.dna.genome import MEMORIES_DIR
 
-from jobs.influencer.core.rules import Limits
+from jobs.influencer.core.rules import MAX_REPLIED_HISTORY
 
 DATA_DIR = MEMORIES_DIR / "influencer"
 QUEUE_FILE = DATA_DIR / "approval_queue.json"
 
 
+def _epoch(value) -> float:
+    """Epoch seconds of a stored timestamp (float, or legacy ISO string)."""
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            return 0.0
+    return float(value or 0)
+
+
 class ApprovalQueue:
     def __init__(self):
         DATA_DIR.mkdir(parents=True, exist_ok=True)
         # SOTA: Added 'approved' for deferred posting (autonomous mode)
         self.queue = {"pending": {}, "approved": {}, "history": []}
+        self._stamp = ()  # Sentinel: never matches a real file stamp
         self._reload()
 
     def _reload(self):
-        """Force reload from disk to sync across processes (API vs Worker)."""
+        """Sync across processes (API vs Worker): re-parse only if the file changed."""
+        stamp = file_stamp(QUEUE_FILE)
+        if stamp == self._stamp:
+            return
         self.queue = load_json(
             QUEUE_FILE, default={"pending": {}, "approved": {}, "history": []}
         )
+        self._stamp = stamp
 
     def _save(self):
         save_json(QUEUE_FILE, self.queue)
+        self._stamp = file_stamp(QUEUE_FILE)
 
     def add(
         self, content_type: str, text: str, image_path: str = None, meta: dict = None
@@ -56,7 +73,7 @@ class ApprovalQueue:
             "text": text,
             "image_path": image_path,
             "meta": meta or {},
-            "created_at": datetime.now().isoformat(),
+            "created_at": time.time(),
             "status": "PENDING",
         }
         self._save()
@@ -72,10 +89,10 @@ class ApprovalQueue:
         """Check if there is a pending item of a specific type."""
 
         self._reload()
-        for item in self.queue.get("pending", {}).values():
-            if item.get("type") == content_type:
-                return True
-        return False
+        return any(
+            item.get("type") == content_type
+            for item in self.queue.get("pending", {}).values()
+        )
 
     def get_next_approved(self) -> Optional[Dict]:
         """Get the next approved item for publishing (FIFO)."""
@@ -85,9 +102,8 @@ class ApprovalQueue:
         if not approved:
             return None
 
-        # Sort by approved_at to ensure FIFO
-        sorted_items = sorted(approved.values(), key=lambda x: x.get("approved_at", ""))
-        return sorted_items[0] if sorted_items else None
+        # Oldest approved_at first (FIFO) - single scan, no full sort
+        return min(approved.values(), key=lambda x: _epoch(x.get("approved_at")))
 
     def approve(self, item_id: str) -> Optional[Dict]:
         """
@@ -96,18 +112,15 @@ class ApprovalQueue:
         Caller is responsible for posting OR letting the orchestrator pick it up.
         """
         self._reload()
-        if item_id in self.queue["pending"]:
-            item = self.queue["pending"].pop(item_id)
+        item = self.queue["pending"].pop(item_id, None)
+        if item:
             item["status"] = "APPROVED"
-            item["approved_at"] = datetime.now().isoformat()
+            item["approved_at"] = time.time()
 
             # Move to approved queue (for deferred posting)
             # Bot will likely post immediately and then call mark_posted
             # But we store it here first to be safe / support async flows
-            if "approved" not in self.queue:
-                self.queue["approved"] = {}
-
-            self.queue["approved"][item_id] = item
+            self.queue.setdefault("approved", {})[item_id] = item
             self._save()
             return item
         return None
@@ -119,33 +132,31 @@ class ApprovalQueue:
             item_id: Internal approval queue ID
             tweet_id: X/Twitter tweet ID for metrics tracking (optional)
         """
-        item = None
         self._reload()
 
         # Check approved first
-        if "approved" in self.queue and item_id in self.queue["approved"]:
-            item = self.queue["approved"].pop(item_id)
+        item = self.queue.get("approved", {}).pop(item_id, None)
         # Check pending (direct post)
-        elif item_id in self.queue["pending"]:
-            item = self.queue["pending"].pop(item_id)
+        if item is None:
+            item = self.queue["pending"].pop(item_id, None)
 
         if item:
             item["status"] = "POSTED"
-            item["posted_at"] = datetime.now().isoformat()
+            item["posted_at"] = time.time()
             if tweet_id:
                 item["tweet_id"] = tweet_id  # Store X tweet ID for metrics
             self.queue["history"].append(item)
-            self.queue["history"] = self.queue["history"][-Limits.MAX_REPLIED_HISTORY :]
+            self.queue["history"] = self.queue["history"][-MAX_REPLIED_HISTORY:]
             self._save()
 
     def reject(self, item_id: str):
         """Remove item from queue."""
 
         self._reload()
-        if item_id in self.queue["pending"]:
-            item = self.queue["pending"].pop(item_id)
+        item = self.queue["pending"].pop(item_id, None)
+        if item:
             item["status"] = "REJECTED"
-            item["rejected_at"] = datetime.now().isoformat()
+            item["rejected_at"] = time.time()
 
             self.queue["history"].append(item)
             self._save()
@@ -7,16 +7,20 @@ PATTERN: Pydantic Model + JSON Persistence.
 ══════════════════════════════════════════════════════════════════════════════
 """
 
+import time
 from typing import Dict, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from loguru import logger
 
-from corpus.soma.cells import load_json, save_json
+from corpus.soma.cells import file_stamp, load_json, save_json
 from corpus.dna.genome import MEMORIES_DIR
 
 # Persistent Storage
 DATA_DIR = MEMORIES_DIR / "influencer"
 CONFIG_FILE = DATA_DIR / "config.json"
+# Serve the cached config without even a stat() for this long (a heartbeat
+# calls load() many times within milliseconds; edits land within a second)
+CONFIG_RECHECK_SECONDS = 1.0
 
 
 class InfluencerConfig(BaseModel):
@@ -63,36 +67,57 @@ class InfluencerConfig(BaseModel):
     priority_only: bool = False
 
 
+# Compiled once: reused for every save() roundtrip
+_ADAPTER = TypeAdapter(InfluencerConfig)
+
+
 class ConfigManager:
     """Singleton to load/save config."""
 
     def __init__(self):
         DATA_DIR.mkdir(parents=True, exist_ok=True)
         self._cache: Optional[InfluencerConfig] = None
+        self._stamp: Optional[tuple] = None
+        self._checked_at = 0.0  # monotonic time of the last stat()
 
     def load(self) -> InfluencerConfig:
-        """Load from disk or return defaults."""
+        """Load from disk or return defaults (re-parsed only if the file changed)."""
+        now = time.monotonic()
+        if self._cache is not None and now - self._checked_at < CONFIG_RECHECK_SECONDS:
+            return self._cache
+        self._checked_at = now
+        stamp = file_stamp(CONFIG_FILE)
+        if self._cache is not None and stamp == self._stamp:
+            return self._cache
         try:
             raw = load_json(CONFIG_FILE, default={})
-            # Validate with Pydantic (fills defaults if missing)
-            config = InfluencerConfig(**raw)
+            # Validate with Pydantic (coerces hand edits, fills defaults).
+            # Runs once per file change: the stamp cache keeps it off the hot path.
+            config = InfluencerConfig.model_validate(raw)
             self._cache = config
+            self._stamp = stamp
             return config
         except Exception as e:
             logger.error(f"⚠️ Config load failed, using defaults: {e}")
-            return InfluencerConfig()  # type: ignore[call-arg]
+            # Pin defaults to this stamp: a broken file is reported once,
+            # and the next edit (new stamp) triggers a fresh parse.
+            self._cache = InfluencerConfig()  # type: ignore[call-arg]
+            self._stamp = stamp
+            return self._cache
 
     def save(self, config: InfluencerConfig):
         """Save to disk."""
+        save_json(CONFIG_FILE, _ADAPTER.dump_python(config))
         self._cache = config
-        save_json(CONFIG_FILE, config.dict())
+        self._stamp = file_stamp(CONFIG_FILE)
         logger.info("💾 Config saved")
 
     def update(self, updates: Dict) -> InfluencerConfig:
         """Update specific fields."""
+        self._checked_at = 0.0  # Read-modify-write: revalidate first
         current = self.load()
-        # Mix Pydantic copy with update
-        updated = current.copy(update=updates)
+        # Re-validate the merge: UI payloads may carry "false" / "30" strings
+        updated = InfluencerConfig.model_validate({**current.model_dump(), **updates})
         self.save(updated)
         return updated
 
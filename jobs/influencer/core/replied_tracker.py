@@ -7,14 +7,16 @@ PURPOSE: Unified tracking of ALL tweet interactions (replied, skipped, etc.)
 ══════════════════════════════════════════════════════════════════════════════
 """
 
+import heapq
+import time
 from datetime import datetime
-from typing import Set, Optional, Literal
+from typing import Iterable, Set, Optional, Literal
 from loguru import logger
 
-from corpus.soma.cells import load_json, save_json
+from corpus.soma.cells import file_stamp, load_json, save_json
 from corpus.dna.genome import MEMORIES_DIR
 
-from jobs.influencer.core.rules import Limits
+from jobs.influencer.core.rules import MAX_REPLIED_HISTORY
 from jobs.influencer.core.config import config_manager
 
 # Shared state file
@@ -22,7 +24,7 @@ DATA_DIR = MEMORIES_DIR / "influencer"
 REPLIED_STATE_FILE = DATA_DIR / "replied_tweets.json"
 
 # Maximum interactions to retain (rolling window)
-MAX_INTERACTION_HISTORY = Limits.MAX_REPLIED_HISTORY
+MAX_INTERACTION_HISTORY = MAX_REPLIED_HISTORY
 
 # Interaction statuses
 InteractionStatus = Literal["replied", "skipped"]
@@ -47,6 +49,17 @@ class RepliedTracker:
 
     def __init__(self):
         DATA_DIR.mkdir(parents=True, exist_ok=True)
+        self._stamp = ()  # Sentinel: never matches a real file stamp
+        self._sync()
+
+    def _sync(self):
+        """
+        Pick up writes from other processes (Worker vs YouTuber).
+        Costs one stat(); re-parses only when another process rewrote the file.
+        """
+        stamp = file_stamp(REPLIED_STATE_FILE)
+        if stamp == self._stamp:
+            return
         self.state = load_json(
             REPLIED_STATE_FILE,
             default={
@@ -56,7 +69,9 @@ class RepliedTracker:
                 "replied_tweet_ids": [],
             },
         )
+        self._stamp = stamp
         self._migrate_legacy()
+        self._rebuild_replied_set()
 
     def _migrate_legacy(self):
         """Migrate old replied_tweet_ids[] to new interactions{} format."""
@@ -67,14 +82,37 @@ class RepliedTracker:
             for tid in legacy_ids:
                 self.state["interactions"][str(tid)] = {
                     "status": "replied",
-                    "at": "2026-01-01T00:00:00",  # Unknown original time
+                    "at": datetime(2026, 1, 1).timestamp(),  # Unknown original time
                 }
             self.state["replied_tweet_ids"] = []  # Clear legacy
             self._save_state()
             logger.success("🔒 [TRACKER] Migration complete")
 
+        # ISO "at" strings -> epoch seconds (cheap float compares in trim)
+        migrated = 0
+        for data in self.state.get("interactions", {}).values():
+            at = data.get("at")
+            if isinstance(at, str):
+                try:
+                    data["at"] = datetime.fromisoformat(at).timestamp()
+                except ValueError:
+                    data["at"] = 0.0
+                migrated += 1
+        if migrated:
+            self._save_state()
+            logger.info(f"🔒 [TRACKER] Converted {migrated} timestamps to epoch")
+
     def _save_state(self):
         save_json(REPLIED_STATE_FILE, self.state)
+        self._stamp = file_stamp(REPLIED_STATE_FILE)
+
+    def _rebuild_replied_set(self):
+        """One scan of interactions -> set of replied tweet IDs."""
+        self._replied_set: Set[str] = {
+            tid
+            for tid, data in self.state.get("interactions", {}).items()
+            if data.get("status") == "replied"
+        }
 
     # ════════════════════════════════════════════════════════════════════════
     # UNIFIED TRACKING (NEW)
@@ -87,8 +125,14 @@ class RepliedTracker:
         This is the MAIN entry point for checking if a tweet should be handled.
         Replaces the old processed_ids check in mentions.json.
         """
-        tweet_id_str = str(tweet_id)
-        return tweet_id_str in self.state.get("interactions", {})
+        self._sync()
+        return str(tweet_id) in self.state.get("interactions", {})
+
+    def get_processed_subset(self, tweet_ids: Iterable[str | int]) -> Set[str]:
+        """Which of these tweet IDs were already processed (one sync for the batch)."""
+        self._sync()
+        interactions = self.state.get("interactions", {})
+        return {tid for tid in map(str, tweet_ids) if tid in interactions}
 
     def mark_skipped(self, tweet_id: str | int, reason: str = "unknown") -> None:
         """
@@ -98,6 +142,7 @@ class RepliedTracker:
             tweet_id: The tweet ID
             reason: Why it was skipped (spam, daily_limit, error, etc.)
         """
+        self._sync()
         tweet_id_str = str(tweet_id)
 
         if self.is_processed(tweet_id_str):
@@ -109,7 +154,7 @@ class RepliedTracker:
         self.state["interactions"][tweet_id_str] = {
             "status": "skipped",
             "reason": reason,
-            "at": datetime.now().isoformat(),
+            "at": time.time(),
         }
 
         self._trim_interactions()
@@ -118,6 +163,7 @@ class RepliedTracker:
 
     def get_interaction(self, tweet_id: str | int) -> Optional[dict]:
         """Get interaction details for a tweet."""
+        self._sync()
         tweet_id_str = str(tweet_id)
         return self.state.get("interactions", {}).get(tweet_id_str)
 
@@ -125,11 +171,14 @@ class RepliedTracker:
         """Keep interactions dict under max size (FIFO)."""
         interactions = self.state.get("interactions", {})
         if len(interactions) > MAX_INTERACTION_HISTORY:
-            # Sort by timestamp and keep newest
-            sorted_items = sorted(
-                interactions.items(), key=lambda x: x[1].get("at", ""), reverse=True
+            # Keep newest by timestamp (partial heap select, no full sort)
+            kept = heapq.nlargest(
+                MAX_INTERACTION_HISTORY,
+                interactions.items(),
+                key=lambda x: x[1].get("at", 0),
             )
-            self.state["interactions"] = dict(sorted_items[:MAX_INTERACTION_HISTORY])
+            self.state["interactions"] = dict(kept)
+            self._replied_set.intersection_update(self.state["interactions"])
 
     # ════════════════════════════════════════════════════════════════════════
     # REPLIED TRACKING (Original API preserved)
@@ -141,12 +190,12 @@ class RepliedTracker:
 
         Note: Use is_processed() to check if tweet was seen at all (replied OR skipped).
         """
-        tweet_id_str = str(tweet_id)
-        interaction = self.state.get("interactions", {}).get(tweet_id_str)
-        return interaction is not None and interaction.get("status") == "replied"
+        self._sync()
+        return str(tweet_id) in self._replied_set
 
     def mark_replied(self, tweet_id: str | int) -> None:
         """Mark a tweet as replied to."""
+        self._sync()
         tweet_id_str = str(tweet_id)
 
         if self.has_replied(tweet_id_str):
@@ -158,20 +207,23 @@ class RepliedTracker:
 
         self.state["interactions"][tweet_id_str] = {
             "status": "replied",
-            "at": datetime.now().isoformat(),
+            "at": time.time(),
         }
+        self._replied_set.add(tweet_id_str)
 
         self._trim_interactions()
         self._save_state()
         logger.debug(f"🔒 [TRACKER] Marked {tweet_id_str} as replied")
 
+    def get_replied_subset(self, tweet_ids: Iterable[str | int]) -> Set[str]:
+        """Which of these tweet IDs were replied to (one sync for the batch)."""
+        self._sync()
+        return self._replied_set.intersection(map(str, tweet_ids))
+
     def get_all_replied(self) -> Set[str]:
-        """Get all tweet IDs that have been replied to."""
-        return set(
-            tid
-            for tid, data in self.state.get("interactions", {}).items()
-            if data.get("status") == "replied"
-        )
+        """Get all tweet IDs that have been replied to (live set, do not mutate)."""
+        self._sync()
+        return self._replied_set
 
     # ════════════════════════════════════════════════════════════════════════
     # THREAD LIMITING (Unchanged)
@@ -179,6 +231,7 @@ class RepliedTracker:
 
     def get_thread_count(self, root_tweet_id: str | int) -> int:
         """Get the number of replies we've sent in a thread."""
+        self._sync()
         root_id_str = str(root_tweet_id)
         return self.state.get("thread_reply_counts", {}).get(root_id_str, 0)
 
@@ -198,6 +251,7 @@ class RepliedTracker:
 
     def increment_thread_count(self, root_tweet_id: str | int) -> int:
         """Increment the reply count for a thread."""
+        self._sync()
         root_id_str = str(root_tweet_id)
 
         if "thread_reply_counts" not in self.state:
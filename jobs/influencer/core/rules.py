@@ -7,50 +7,112 @@ PHILOSOPHY: Defense-first (strict limits), organic timing (Fibonacci).
 ══════════════════════════════════════════════════════════════════════════════
 """
 
-from corpus.soma.cells import load_json, save_json
+import re
+from bisect import bisect_left
+from datetime import date
+from typing import Any, Final, Optional
+
+from loguru import logger
+
+from corpus.soma.cells import load_json, save_json, save_json_async
 from corpus.dna.genome import MEMORIES_DIR
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+    logger.warning("📜 [RULES] pyahocorasick not installed. Run: pip install pyahocorasick")
+
+try:
+    import hyperscan  # Optional: x86-only, used for large keyword lists
+except ImportError:
+    hyperscan = None
+
+HYPERSCAN_MIN_KEYWORDS = 50  # Below this, Aho-Corasick is already fast enough
+
 PRIORITIES_FILE = MEMORIES_DIR / "influencer" / "priorities.json"
 
 
-class Limits:
-    """Hard constraints to prevent API bans and spam."""
+def _mtime(path) -> int:
+    """File mtime (ns), 0 if missing. Used to pick up on-disk edits lazily."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
 
-    # Mentions (Reading)
-    MAX_READS_PER_DAY = 2
-    MAX_MENTION_AGE_DAYS = 233  # F233 (Fibonacci) ~8 months
 
-    # Replies (Writing)
-    MAX_REPLIES_PER_DAY = 10
-    # MAX_REPLIES_PER_THREAD moved to config.py
+# ── LIMITS (module-level Final: hot paths read a global, not a class attr) ──
+# Mentions (Reading)
+MAX_READS_PER_DAY: Final[int] = 2
+MAX_MENTION_AGE_DAYS: Final[int] = 233  # F233 (Fibonacci) ~8 months
 
-    # Posts (Original Content)
-    MAX_POSTS_PER_DAY = 5  # F5
+# Replies (Writing)
+MAX_REPLIES_PER_DAY: Final[int] = 10
+# MAX_REPLIES_PER_THREAD moved to config.py
 
-    # History Tracking
-    MAX_REPLIED_HISTORY = 500  # Rolling window size
+# Posts (Original Content)
+MAX_POSTS_PER_DAY: Final[int] = 5  # F5
 
+# History Tracking
+MAX_REPLIED_HISTORY: Final[int] = 500  # Rolling window size
+
+# ── TIMINGS ──
+# Orchestrator Heartbeat
+HEARTBEAT_INTERVAL_MINUTES: Final[int] = 89  # F89
+
+# Mentions Routine
+CHECK_INTERVAL_HOURS: Final[int] = 12  # 2x/day
+
+# Posting Cooldown
+POST_COOLDOWN_MINUTES: Final[int] = 21  # F21
+
+# Grok Banter
+BANTER_INTERVAL_DAYS: Final[int] = 2  # F2
 
-class Timings:
-    """Fibonacci-based intervals for organic behavior."""
 
-    # Orchestrator Heartbeat
-    HEARTBEAT_INTERVAL_MINUTES = 89  # F89
+class Limits:
+    """Hard constraints to prevent API bans and spam (facade over module constants)."""
 
-    # Mentions Routine
-    CHECK_INTERVAL_HOURS = 12  # 2x/day
+    MAX_READS_PER_DAY = MAX_READS_PER_DAY
+    MAX_MENTION_AGE_DAYS = MAX_MENTION_AGE_DAYS
+    MAX_REPLIES_PER_DAY = MAX_REPLIES_PER_DAY
+    MAX_POSTS_PER_DAY = MAX_POSTS_PER_DAY
+    MAX_REPLIED_HISTORY = MAX_REPLIED_HISTORY
 
-    # Posting Cooldown
-    POST_COOLDOWN_MINUTES = 21  # F21
 
-    # Grok Banter
-    BANTER_INTERVAL_DAYS = 2  # F2
+class Timings:
+    """Fibonacci-based intervals for organic behavior (facade over module constants)."""
+
+    HEARTBEAT_INTERVAL_MINUTES = HEARTBEAT_INTERVAL_MINUTES
+    CHECK_INTERVAL_HOURS = CHECK_INTERVAL_HOURS
+    POST_COOLDOWN_MINUTES = POST_COOLDOWN_MINUTES
+    BANTER_INTERVAL_DAYS = BANTER_INTERVAL_DAYS
+
+
+def roll_daily_counter(state: dict, counter_key: str) -> bool:
+    """
+    Zero `state[counter_key]` on a new day. Returns True when it was reset
+    (caller persists). The day is an ordinal int: no strftime per heartbeat.
+    """
+    today = date.today().toordinal()
+    if "today_ordinal" not in state and state.get("today_date"):
+        # Migration: keep today's counter from ISO-only state
+        state["today_ordinal"] = date.fromisoformat(state["today_date"]).toordinal()
+    if state.get("today_ordinal") == today:
+        return False
+    state["today_ordinal"] = today
+    # ISO string kept for the API dashboard (written once per day)
+    state["today_date"] = date.fromordinal(today).isoformat()
+    state[counter_key] = 0
+    return True
 
 
 class Priorities:
     """Hierarchy of attention."""
 
-    _ACCOUNTS = None  # Cache
+    _ACCOUNTS: Optional[tuple] = None  # Cache (read-only, safe to share across tasks)
+    _MTIME = 0  # mtime of the loaded file
+    _INDEX: Optional[dict] = None  # {username_lower: priority}
 
     DEFAULTS = [
         {"username": "julienpironfr", "description": "Father"},
@@ -58,46 +120,86 @@ class Priorities:
     ]
 
     @staticmethod
-    def _ensure_loaded():
-        if Priorities._ACCOUNTS is None:
-            # Ensure dir exists
-            PRIORITIES_FILE.parent.mkdir(parents=True, exist_ok=True)
-            Priorities._ACCOUNTS = load_json(
-                PRIORITIES_FILE, default=Priorities.DEFAULTS
-            )
+    def _ensure_loaded() -> dict:
+        """Load/refresh the accounts; returns the {username_lower: priority} index."""
+        mtime = _mtime(PRIORITIES_FILE)
+        accounts = Priorities._ACCOUNTS
+        if accounts is None or mtime != Priorities._MTIME:
+            accounts = tuple(load_json(PRIORITIES_FILE, default=Priorities.DEFAULTS))
+            Priorities._ACCOUNTS = accounts
+            Priorities._MTIME = mtime
+            Priorities._INDEX = None
+        index = Priorities._INDEX
+        if index is None:
+            index = {}
+            for i, acc in enumerate(accounts):
+                index.setdefault(acc["username"].lower(), i)  # First entry wins
+            Priorities._INDEX = index
+        return index
 
     @staticmethod
-    def get_all() -> list:
-        """Get list of priority accounts."""
+    def get_all() -> tuple:
+        """Get priority accounts (read-only; use list(...) for a mutable copy)."""
         Priorities._ensure_loaded()
-        return Priorities._ACCOUNTS
+        return Priorities._ACCOUNTS or ()
 
     @staticmethod
     def save(accounts: list):
         """Save new priority list."""
-        Priorities._ACCOUNTS = accounts
+        Priorities._ACCOUNTS = tuple(accounts)
+        Priorities._INDEX = None  # Rebuilt on next lookup
         save_json(PRIORITIES_FILE, accounts)
+        Priorities._MTIME = _mtime(PRIORITIES_FILE)  # No false reload
+
+    @staticmethod
+    async def save_async(accounts: list):
+        """Save new priority list without blocking the event loop."""
+        Priorities._ACCOUNTS = tuple(accounts)
+        Priorities._INDEX = None
+        await save_json_async(PRIORITIES_FILE, accounts)
+        Priorities._MTIME = _mtime(PRIORITIES_FILE)
 
     @staticmethod
     def get_priority(username: str) -> int:
         """Get priority score for a user (lower = higher priority)."""
-        Priorities._ensure_loaded()
-        username_lower = username.lower()
-
-        for i, acc in enumerate(Priorities._ACCOUNTS):
-            if acc["username"].lower() == username_lower:
-                return i
+        return Priorities._ensure_loaded().get(username.lower(), 999)  # 999 = others
 
-        return 999  # Low priority for others
+    @staticmethod
+    def get_priority_batch(usernames: list) -> list:
+        """Priorities for a page of users (one load/mtime check for the whole batch)."""
+        get = Priorities._ensure_loaded().get
+        return [get(u.lower(), 999) for u in usernames]
 
 
 SPAM_KEYWORDS_FILE = MEMORIES_DIR / "influencer" / "spam_words.json"
 
 
+def _prune_keywords(keywords) -> frozenset:
+    """
+    Lowercase, dedupe and drop keywords containing a shorter one
+    ("sales", "presale" are covered by "sale"): is_spam is a yes/no substring test.
+    """
+    pruned = []
+    for kw in sorted({k.lower() for k in keywords if k}, key=len):
+        if not any(p in kw for p in pruned):
+            pruned.append(kw)
+    return frozenset(pruned)
+
+
+def _stop_at_first_match(*_args) -> bool:
+    """Hyperscan match callback: a truthy return halts the scan."""
+    return True
+
+
 class SpamFilter:
     """Blocklists to ignore (Dynamic)."""
 
-    _KEYWORDS = None  # Cache
+    _KEYWORDS: Optional[list] = None  # Cache
+    _MTIME = 0  # mtime of the loaded file
+    _KEYWORDS_LOWER: Optional[frozenset] = None  # lowercased + pruned once per load/save
+    _AUTOMATON: Optional[Any] = None  # Aho-Corasick matcher over lowercased keywords
+    _PATTERN: Optional[re.Pattern] = None  # Fallback when pyahocorasick is missing
+    _HS_DB: Any = None  # hyperscan.Database | None (large lists, if installed)
 
     DEFAULTS = [
         "sales",
@@ -133,32 +235,147 @@ class SpamFilter:
 
     @staticmethod
     def _ensure_loaded():
-        if SpamFilter._KEYWORDS is None:
-            # Ensure dir exists
-            SPAM_KEYWORDS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        mtime = _mtime(SPAM_KEYWORDS_FILE)
+        if SpamFilter._KEYWORDS is None or mtime != SpamFilter._MTIME:
             SpamFilter._KEYWORDS = load_json(
                 SPAM_KEYWORDS_FILE, default=SpamFilter.DEFAULTS
             )
+            SpamFilter._MTIME = mtime
+            SpamFilter._invalidate()  # Derived matchers follow the file
+        if SpamFilter._KEYWORDS_LOWER is None:
+            SpamFilter._KEYWORDS_LOWER = _prune_keywords(SpamFilter._KEYWORDS)
+            if hyperscan and len(SpamFilter._KEYWORDS_LOWER) > HYPERSCAN_MIN_KEYWORDS:
+                SpamFilter._HS_DB = SpamFilter._compile_hyperscan(
+                    SpamFilter._KEYWORDS_LOWER
+                )
+        if SpamFilter._HS_DB is not None:
+            return
+        if SpamFilter._AUTOMATON is None and ahocorasick and SpamFilter._KEYWORDS_LOWER:
+            automaton = ahocorasick.Automaton()
+            for keyword in SpamFilter._KEYWORDS_LOWER:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            SpamFilter._AUTOMATON = automaton
+        if SpamFilter._PATTERN is None and not ahocorasick and SpamFilter._KEYWORDS_LOWER:
+            SpamFilter._PATTERN = re.compile(
+                "|".join(re.escape(k) for k in SpamFilter._KEYWORDS_LOWER),
+                re.IGNORECASE,
+            )
+
+    @staticmethod
+    def _compile_hyperscan(keywords):
+        """Compile lowercased keywords into a Hyperscan DB (None on failure)."""
+        if hyperscan is None:
+            return None
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[re.escape(k).encode() for k in keywords],
+                ids=list(range(len(keywords))),
+                elements=len(keywords),
+                # No SINGLEMATCH: a batch scan needs every hit (one per tweet)
+                flags=[hyperscan.HS_FLAG_CASELESS] * len(keywords),
+            )
+            return db
+        except Exception as e:
+            logger.warning(f"📜 [RULES] Hyperscan compile failed, falling back: {e}")
+            return None
+
+    @staticmethod
+    def _hs_match(text: str) -> bool:
+        if hyperscan is None:  # _HS_DB is only ever built with hyperscan
+            return False
+        try:
+            SpamFilter._HS_DB.scan(
+                text.lower().encode(), match_event_handler=_stop_at_first_match
+            )
+        except hyperscan.ScanTerminated:
+            return True
+        return False
+
+    @staticmethod
+    def _hs_match_batch(texts: list) -> list:
+        """
+        One Hyperscan block scan over the whole page: texts are joined with NUL
+        (never part of a keyword) and each hit's end offset is mapped back
+        to its tweet.
+        """
+        hits = [False] * len(texts)
+        if not texts:
+            return hits
+        chunks = [t.lower().encode() for t in texts]
+        ends = []  # Offset of the NUL that closes each text
+        pos = -1
+        for chunk in chunks:
+            pos += len(chunk) + 1
+            ends.append(pos)
+
+        def on_match(_id, _from, to, _flags, _context):
+            hits[bisect_left(ends, to)] = True
+
+        SpamFilter._HS_DB.scan(b"\0".join(chunks), match_event_handler=on_match)
+        return hits
+
+    @staticmethod
+    def _invalidate():
+        SpamFilter._KEYWORDS_LOWER = None
+        SpamFilter._AUTOMATON = None
+        SpamFilter._PATTERN = None
+        SpamFilter._HS_DB = None
 
     @staticmethod
     def get_keywords() -> list:
         """Get list of spam keywords."""
         SpamFilter._ensure_loaded()
-        return SpamFilter._KEYWORDS
+        return SpamFilter._KEYWORDS or []
 
     @staticmethod
     def save(keywords: list):
         """Save new spam keywords list."""
         SpamFilter._KEYWORDS = keywords
+        SpamFilter._invalidate()  # Rebuilt on next check
         save_json(SPAM_KEYWORDS_FILE, keywords)
+        SpamFilter._MTIME = _mtime(SPAM_KEYWORDS_FILE)  # No false reload
+
+    @staticmethod
+    async def save_async(keywords: list):
+        """Save new spam keywords list without blocking the event loop."""
+        SpamFilter._KEYWORDS = keywords
+        SpamFilter._invalidate()
+        await save_json_async(SPAM_KEYWORDS_FILE, keywords)
+        SpamFilter._MTIME = _mtime(SPAM_KEYWORDS_FILE)
 
     @staticmethod
     def is_spam(text: str) -> bool:
         """Check if text contains spam keywords."""
         SpamFilter._ensure_loaded()
-        text_lower = text.lower()
-        keywords = SpamFilter._KEYWORDS or []
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
+        if SpamFilter._HS_DB is not None:
+            return SpamFilter._hs_match(text)
+        if SpamFilter._AUTOMATON is not None:
+            # Single linear pass over text, whatever the keyword count
+            for _ in SpamFilter._AUTOMATON.iter(text.lower()):
                 return True
-        return False
+            return False
+        # Fallback: one C-level regex pass (no lowercase copy of text)
+        pattern = SpamFilter._PATTERN
+        return pattern is not None and pattern.search(text) is not None
+
+    @staticmethod
+    def is_spam_batch(texts: list) -> list:
+        """Check a page of texts at once (one load/mtime check for the whole batch)."""
+        SpamFilter._ensure_loaded()
+        if SpamFilter._HS_DB is not None:
+            return SpamFilter._hs_match_batch(texts)
+        automaton = SpamFilter._AUTOMATON
+        if automaton is not None:
+            return [next(automaton.iter(t.lower()), None) is not None for t in texts]
+        pattern = SpamFilter._PATTERN
+        if pattern is None:
+            return [False] * len(texts)
+        search = pattern.search
+        return [search(t) is not None for t in texts]
+
+
+# Ensure storage dirs exist (once, at import)
+PRIORITIES_FILE.parent.mkdir(parents=True, exist_ok=True)
+SPAM_KEYWORDS_FILE.parent.mkdir(parents=True, exist_ok=True)
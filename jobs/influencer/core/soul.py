@@ -0,0 +1,53 @@
+"""
+JOBS/INFLUENCER/CORE/SOUL.PY
+══════════════════════════════════════════════════════════════════════════════
+MODULE: SHARED SOUL CONTEXT CACHE 🧠
+PURPOSE: spirit.get_context() cached per complexity level for all generators.
+         Single TTL, stale-while-revalidate (Grok, Trinity, ...).
+══════════════════════════════════════════════════════════════════════════════
+"""
+
+import asyncio
+import time
+from typing import Dict, Tuple
+from loguru import logger
+
+from corpus.soul.spirit import spirit
+
+# Spirit context changes slowly: fresh for a few minutes, then served stale
+# while one background task refreshes it
+SOUL_TTL_SECONDS = 300
+SOUL_MAX_STALE_SECONDS = 3600  # Older than this: wait for a fresh one
+
+_CACHE: Dict[str, Tuple[float, str]] = {}  # level -> (fetched_at, context)
+_REFRESH: Dict[str, asyncio.Task] = {}  # level -> in-flight refresh
+
+
+async def _fetch(complexity_level: str) -> str:
+    context = await spirit.get_context(complexity_level=complexity_level)
+    _CACHE[complexity_level] = (time.monotonic(), context)
+    return context
+
+
+async def _refresh(complexity_level: str):
+    try:
+        await _fetch(complexity_level)
+    except Exception as e:
+        logger.warning(f"🧠 [SOUL] Refresh failed ({complexity_level}): {e}")
+
+
+async def soul_context(complexity_level: str = "standard") -> str:
+    """spirit.get_context(complexity_level), cached with stale-while-revalidate."""
+    cached = _CACHE.get(complexity_level)
+    if cached:
+        age = time.monotonic() - cached[0]
+        if age < SOUL_TTL_SECONDS:
+            return cached[1]
+        if age < SOUL_MAX_STALE_SECONDS:
+            task = _REFRESH.get(complexity_level)
+            if task is None or task.done():
+                _REFRESH[complexity_level] = asyncio.create_task(
+                    _refresh(complexity_level)
+                )
+            return cached[1]
+    return await _fetch(complexity_level)
@@ -7,72 +7,142 @@ USAGE: Imported by Grok, Poster, Mentions, etc.
 ══════════════════════════════════════════════════════════════════════════════
 """
 
+import asyncio
+import functools
+import time
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 from loguru import logger
 
 from corpus.brain.gattaca import gattaca, ROUTE_CREATE
 
 
-class VisualEngine:
+# Style presets (suffixes appended to the base prompt)
+_STYLE_SUFFIXES = {
+    "default": """
+Style:
+- Dark mode aesthetic (black background)
+- Neon accents (cyan, magenta)
+- Abstract data visualization / circuit lines
+- Mathematical beauty / Fibonacci spirals
+- NO TEXT in the image
+- High tech, sleek, "Google DeepMind" vibe
+""",
+    # Future modes can be added here
+}
+
+
+# Negative cache: prompt hash -> expiry (monotonic). Skips re-calling Imagen
+# for prompts that just failed, e.g. during an upstream outage.
+_FAILURE_TTL_SECONDS = 600
+_FAILURE_CACHE_MAX = 128
+_RECENT_FAILURES: dict = {}
+
+
+def _recently_failed(key: int) -> bool:
+    expiry = _RECENT_FAILURES.get(key)
+    if expiry is None:
+        return False
+    if expiry <= time.monotonic():
+        del _RECENT_FAILURES[key]
+        return False
+    return True
+
+
+def _remember_failure(key: int) -> None:
+    now = time.monotonic()
+    if len(_RECENT_FAILURES) >= _FAILURE_CACHE_MAX:
+        for k in [k for k, exp in _RECENT_FAILURES.items() if exp <= now]:
+            del _RECENT_FAILURES[k]
+    while len(_RECENT_FAILURES) >= _FAILURE_CACHE_MAX:
+        del _RECENT_FAILURES[next(iter(_RECENT_FAILURES))]  # Oldest first
+    _RECENT_FAILURES.pop(key, None)  # Re-insert at the end
+    _RECENT_FAILURES[key] = now + _FAILURE_TTL_SECONDS
+
+
+@functools.lru_cache(maxsize=256)
+def _build_prompt(text: str, mode: str) -> str:
+    """Construct the Imagen prompt based on mode."""
+    return (
+        f"""Create a minimalist, abstract cybernetic image representing this concept:
+"{text}"
+"""
+        + _STYLE_SUFFIXES.get(mode, "")
+    )
+
+
+async def generate(context_text: str, style_mode: str = "default") -> Optional[Path]:
     """
-    The Visual Cortex of the Influencer Job.
-    Generates images based on text context using Gattaca (Imagen).
+    Generate an image for a given context.
+
+    Args:
+        context_text: The tweet or concept to visualize.
+        style_mode: Style preset (default, abstract, meme, etc.)
+
+    Returns:
+        Path to the generated image file, or None if failed.
     """
+    prompt = _build_prompt(context_text, style_mode)
+    key = hash(prompt)
+    if _recently_failed(key):
+        logger.info("🎨 [VISUALS] Short-circuit (recent failure)")
+        return None
+
+    try:
+        logger.opt(lazy=True).info(
+            "🎨 [VISUALS] Generating for: {}...", lambda: context_text[:30]
+        )
+        images = await gattaca.think(prompt, ROUTE_CREATE)
+
+        if images and isinstance(images, list) and len(images) > 0:
+            image_path = Path(images[0])
+            logger.opt(lazy=True).success(
+                "🎨 [VISUALS] Success: {}", lambda: image_path.name
+            )
+            return image_path
+
+        logger.warning("🎨 [VISUALS] No images returned.")
+        _remember_failure(key)
+        return None
 
-    async def generate(
-        self, context_text: str, style_mode: str = "default"
-    ) -> Optional[Path]:
-        """
-        Generate an image for a given context.
+    except Exception as e:
+        logger.error("🎨 [VISUALS] Generation failed: {}", e)
+        _remember_failure(key)
+        return None
 
-        Args:
-            context_text: The tweet or concept to visualize.
-            style_mode: Style preset (default, abstract, meme, etc.)
 
-        Returns:
-            Path to the generated image file, or None if failed.
-        """
-        prompt = self._build_prompt(context_text, style_mode)
+async def generate_many(
+    contexts: List[str], style_mode: str = "default", concurrency: int = 5
+) -> List[Optional[Path]]:
+    """
+    Generate images for several contexts concurrently.
 
-        try:
-            logger.info(f"🎨 [VISUALS] Generating for: {context_text[:30]}...")
-            images = await gattaca.think(prompt, ROUTE_CREATE)
+    Args:
+        contexts: Tweets or concepts to visualize.
+        style_mode: Style preset applied to every image.
+        concurrency: Max in-flight Imagen requests (rate-limit guard).
 
-            if images and isinstance(images, list) and len(images) > 0:
-                image_path = Path(images[0])
-                logger.success(f"🎨 [VISUALS] Success: {image_path.name}")
-                return image_path
+    Returns:
+        One Path (or None if failed) per context, in input order.
+    """
+    sem = asyncio.Semaphore(concurrency)
 
-            logger.warning("🎨 [VISUALS] No images returned.")
-            return None
+    async def _one(text: str) -> Optional[Path]:
+        async with sem:
+            return await generate(text, style_mode)
 
-        except Exception as e:
-            logger.error(f"🎨 [VISUALS] Generation failed: {e}")
-            return None
+    return await asyncio.gather(*[_one(t) for t in contexts])
 
-    def _build_prompt(self, text: str, mode: str) -> str:
-        """Construct the Imagen prompt based on mode."""
 
-        base_prompt = f"""Create a minimalist, abstract cybernetic image representing this concept:
-"{text}"
-"""
+class VisualEngine:
+    """
+    The Visual Cortex of the Influencer Job.
+    Stateless namespace kept for back-compat: prefer the module-level functions.
+    """
 
-        if mode == "default":
-            return (
-                base_prompt
-                + """
-Style:
-- Dark mode aesthetic (black background)
-- Neon accents (cyan, magenta)
-- Abstract data visualization / circuit lines
-- Mathematical beauty / Fibonacci spirals
-- NO TEXT in the image
-- High tech, sleek, "Google DeepMind" vibe
-"""
-            )
-        # Future modes can be added here
-        return base_prompt
+    generate = staticmethod(generate)
+    generate_many = staticmethod(generate_many)
+    _build_prompt = staticmethod(_build_prompt)
 
 
 # Singleton
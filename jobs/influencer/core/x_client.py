@@ -11,12 +11,21 @@ FEATURES:
 """
 
 import asyncio
+import atexit
+import concurrent.futures
+import hashlib
+import heapq
 import logging
 import os
+import sys
+import time
+from datetime import date, datetime
+from itertools import pairwise
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from loguru import logger
-from corpus.soma.cells import load_json, save_json
+from corpus.soma.cells import dumps, file_stamp, load_json, save_json
 from corpus.dna.genome import MEMORIES_DIR
 
 # SOTA 2026: Silence Tweepy's internal rate limit spam
@@ -24,13 +33,62 @@ logging.getLogger("tweepy").setLevel(logging.ERROR)
 logging.getLogger("tweepy.client").setLevel(logging.ERROR)
 logging.getLogger("tweepy.api").setLevel(logging.ERROR)
 
-try:
-    import tweepy
-    from tweepy.asynchronous import AsyncClient
-except ImportError:
-    tweepy = None
-    AsyncClient = None
-    logger.warning("📱 [X_CLIENT] tweepy not installed. Run: pip install tweepy")
+# tweepy (+ requests/oauthlib/aiohttp) is imported lazily in authenticate():
+# cache-only paths (verify_credentials, get_mentions) never pay for it.
+
+# (key, header) pairs recorded by _capture_headers
+_RATE_LIMIT_HEADERS = (
+    ("limit", "x-rate-limit-limit"),
+    ("remaining", "x-rate-limit-remaining"),
+    ("reset", "x-rate-limit-reset"),
+    ("app_remaining", "x-app-limit-24hour-remaining"),
+    ("app_reset", "x-app-limit-24hour-reset"),
+)
+
+IDENTITY_CACHE_TTL = 60  # Seconds an in-memory identity is trusted
+# Reused by sync wrappers called from inside a running loop (no pool per call)
+_BG_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="x_client_sync"
+)
+
+API_CONCURRENCY_START = 2  # In-flight V2 calls
+API_CONCURRENCY_MAX = 4
+METRICS_CACHE_MAX = 5000  # Tweets kept in x_metrics_cache.json (newest first)
+
+
+def _tweet_id_key(entry: Dict) -> int:
+    """Sort key for cached tweets: snowflake IDs compare as ints, not strings."""
+    try:
+        return int(entry.get("id") or 0)
+    except (TypeError, ValueError):
+        return 0  # Malformed legacy entry: sinks to the end
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """True for HTTP 429 / usage-cap errors from tweepy."""
+    tweepy = sys.modules.get("tweepy")  # Not imported yet -> can't be its error
+    if tweepy and isinstance(error, tweepy.errors.TooManyRequests):
+        return True
+    return "429" in str(error)
+
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_ID_AND_USERNAME = attrgetter("id", "username")  # includes.users -> (id, name)
+
+
+def _epoch_day() -> int:
+    """Today as a UTC day number (int compare, no strftime)."""
+    return int(time.time() // 86400)
+
+
+def _stored_day(value: Any) -> int:
+    """Day number of a persisted date: int, or legacy 'YYYY-MM-DD' string."""
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value).toordinal() - _EPOCH_ORDINAL
+        except ValueError:
+            return -1
+    return value if isinstance(value, int) else -1
 
 
 class XClient:
@@ -43,12 +101,53 @@ class XClient:
     - Async wrappers for legacy V1.1 media uploads
     """
 
+    # Fixed attribute set: no per-instance __dict__, faster self.X lookups
+    __slots__ = (
+        "api_v1",
+        "client_v2",
+        "async_client_v2",
+        "_authenticated",
+        "_last_headers",
+        "_tweepy",
+        "_AsyncClient",
+        "IDENTITY_FILE",
+        "QUOTA_FILE",
+        "DAILY_READ_LIMIT",
+        "MENTIONS_FILE",
+        "METRICS_FILE",
+        "SYNC_STATE_FILE",
+        "_last_identity_failure",
+        "user_id",
+        "_identity_cache",
+        "_identity_cache_ts",
+        "_file_cache",
+        "_write_hashes",
+        "_quota_state",
+        "_quota_stamp",
+        "_quota_dirty",
+        "_quota_flush_ts",
+        "_concurrency",
+        "_api_slot",
+        "_api_inflight",
+        "_pulse_task",
+    )
+
+    # V2 field lists, pre-joined: tweepy only comma-joins list values (not
+    # tuples) and passes strings through untouched.
+    _ME_USER_FIELDS = "public_metrics"
+    _MENTION_USER_FIELDS = "username,public_metrics"
+    _MENTION_EXPANSIONS = "author_id"
+    _METRIC_TWEET_FIELDS = "public_metrics,created_at"
+    _METRIC_EXCLUDE = "retweets,replies"
+
     def __init__(self):
         self.api_v1: Optional[Any] = None  # tweepy.API
         self.client_v2: Optional[Any] = None  # tweepy.Client
         self.async_client_v2: Optional[Any] = None  # AsyncClient
         self._authenticated = False
         self._last_headers: Dict[str, Any] = {}
+        self._tweepy: Optional[Any] = None  # Module, imported on first auth
+        self._AsyncClient: Optional[Any] = None
 
         # Identity Cache
         self.IDENTITY_FILE = MEMORIES_DIR / "influencer" / "identity.json"
@@ -62,20 +161,45 @@ class XClient:
         self.METRICS_FILE = MEMORIES_DIR / "influencer" / "x_metrics_cache.json"
         self.SYNC_STATE_FILE = MEMORIES_DIR / "influencer" / "daily_sync.json"
 
+        # All caches share one dir: create it once, not on every save
+        (MEMORIES_DIR / "influencer").mkdir(parents=True, exist_ok=True)
+
         # Runtime Failure Backoff
         self._last_identity_failure = 0.0
+        self.user_id: Optional[str] = None  # Set by verify_credentials
+
+        # In-memory caches (skip re-parsing JSON on every call)
+        self._identity_cache: Optional[Dict] = None
+        self._identity_cache_ts = 0.0
+        self._file_cache: Dict[Path, tuple] = {}  # path -> (stamp, data)
+        self._write_hashes: Dict[Path, tuple] = {}  # path -> (digest, stamp) of last write
+
+        # Quota counter lives in RAM; disk writes are throttled (flushed at exit)
+        self._quota_state: Optional[Dict] = None
+        self._quota_stamp: Optional[tuple] = ()  # Sentinel: never a real stamp
+        self._quota_dirty = False
+        self._quota_flush_ts = 0.0
+        atexit.register(self._flush_quota, True)
+
+        # V2 concurrency: one resizable limiter, AIMD-sized (halve on 429,
+        # +0.5 per success). A shrink applies to the next admission at once.
+        self._concurrency = float(API_CONCURRENCY_START)
+        self._api_slot = asyncio.Condition()
+        self._api_inflight = 0
+        self._pulse_task: Optional[asyncio.Task] = None  # In-flight Pulse (shared)
 
     def _load_identity(self) -> Optional[Dict]:
-        """Load cached identity from disk."""
-        try:
-            if self.IDENTITY_FILE.exists():
-                return load_json(self.IDENTITY_FILE)
-        except Exception:
-            pass
-        return None
+        """Load cached identity (memory for IDENTITY_CACHE_TTL, then disk)."""
+        if (
+            self._identity_cache is not None
+            and time.monotonic() - self._identity_cache_ts < IDENTITY_CACHE_TTL
+        ):
+            return self._identity_cache
         try:
             if self.IDENTITY_FILE.exists():
-                return load_json(self.IDENTITY_FILE)
+                self._identity_cache = load_json(self.IDENTITY_FILE)
+                self._identity_cache_ts = time.monotonic()
+                return self._identity_cache
         except Exception:
             pass
         return None
@@ -83,46 +207,85 @@ class XClient:
     def _save_identity(self, data: Dict):
         """Save identity to disk."""
         try:
-            self.IDENTITY_FILE.parent.mkdir(parents=True, exist_ok=True)
-            save_json(self.IDENTITY_FILE, data)
+            self._write_if_changed(self.IDENTITY_FILE, data)
+            self._identity_cache = data
+            self._identity_cache_ts = time.monotonic()
         except Exception as e:
             logger.warning(f"Failed to save identity: {e}")
 
+    def _write_if_changed(self, path: Path, data: Any):
+        """
+        Atomic save (cells.save_json), skipped when the payload matches the
+        last one written to this path and nobody touched the file since.
+        """
+        digest = hashlib.blake2b(dumps(data, indent=0), digest_size=16).digest()
+        last = self._write_hashes.get(path)
+        if last and last[0] == digest and last[1] == file_stamp(path):
+            return
+        save_json(path, data)
+        self._write_hashes[path] = (digest, file_stamp(path))
+
+    def _load_cached(self, path: Path) -> Optional[Any]:
+        """Load a JSON cache file, re-parsing only when it changed on disk."""
+        stamp = file_stamp(path)
+        if stamp is None:
+            return None
+        hit = self._file_cache.get(path)
+        if hit and hit[0] == stamp:
+            return hit[1]
+        try:
+            data = load_json(path)
+        except Exception:
+            return None
+        self._file_cache[path] = (stamp, data)
+        return data
+
+    def _save_cached(self, path: Path, data: Any):
+        """Save a JSON cache file and keep the parsed copy in memory."""
+        self._write_if_changed(path, data)
+        self._file_cache[path] = (file_stamp(path), data)
+
+    def _read_mentions_cache(self) -> List[Dict]:
+        loaded = self._load_cached(self.MENTIONS_FILE)
+        if loaded and isinstance(loaded, dict):
+            return loaded.get("data", [])
+        return []
+
     def _check_limit(self) -> bool:
         """
         SOTA 2026: Strict Global Read Limit Guard.
         Returns TRUE if allowed, FALSE if limit reached.
         """
+        return self._reserve_slots(1)
+
+    def _reserve_slots(self, n: int, today: Optional[int] = None) -> bool:
+        """
+        Reserve n read slots at once: all or nothing.
+        Returns TRUE if reserved, FALSE if the daily limit has no room for n.
+        """
         try:
-            from datetime import datetime
+            today = _epoch_day() if today is None else today
 
-            today = datetime.now().strftime("%Y-%m-%d")
-
-            # Load State
-            state = {"date": today, "count": 0}
-            if self.QUOTA_FILE.exists():
-                try:
-                    state = load_json(self.QUOTA_FILE)
-                except Exception:
-                    pass
+            # Load State (memory; re-read only if the file changed under us)
+            state = self._load_quota()
 
             # Reset if new day
-            if state.get("date") != today:
-                state = {"date": today, "count": 0}
+            if _stored_day(state.get("date")) != today:
+                state = self._quota_state = {"date": today, "count": 0}
 
             # Check Limit
-            if state["count"] >= self.DAILY_READ_LIMIT:
+            if state["count"] + n > self.DAILY_READ_LIMIT:
                 logger.info(
                     f"🛑 [X_CLIENT] Global Daily Limit Reached ({state['count']}/{self.DAILY_READ_LIMIT})"
                 )
                 return False
 
-            # Increment (Optimistic - we assume we will make the call)
-            state["count"] += 1
+            # Increment (Optimistic - we assume we will make the calls)
+            state["count"] += n
 
-            # Save
-            self.QUOTA_FILE.parent.mkdir(parents=True, exist_ok=True)
-            save_json(self.QUOTA_FILE, state)
+            # Save (at most once per second)
+            self._quota_dirty = True
+            self._flush_quota()
 
             logger.info(
                 f"🎫 [X_CLIENT] Quota Used: {state['count']}/{self.DAILY_READ_LIMIT}"
@@ -135,32 +298,127 @@ class XClient:
             # Let's Allow to avoid total lock, but log error.
             return True
 
+    def _load_quota(self) -> Dict:
+        """In-memory quota state, reloaded only when the file changed on disk."""
+        stamp = file_stamp(self.QUOTA_FILE)
+        if self._quota_state is None or (
+            stamp != self._quota_stamp and not self._quota_dirty
+        ):
+            state = None
+            if stamp is not None:
+                try:
+                    state = load_json(self.QUOTA_FILE)
+                except Exception:
+                    pass
+            self._quota_state = state if isinstance(state, dict) else {}
+            self._quota_stamp = stamp
+        return self._quota_state
+
+    def _flush_quota(self, force: bool = False):
+        """Persist the quota counter if dirty (throttled to 1 write/s unless forced)."""
+        if not self._quota_dirty:
+            return
+        now = time.monotonic()
+        if not force and now - self._quota_flush_ts <= 1.0:
+            return
+        try:
+            self._write_if_changed(self.QUOTA_FILE, self._quota_state)
+            self._quota_stamp = file_stamp(self.QUOTA_FILE)
+            self._quota_dirty = False
+            self._quota_flush_ts = now
+        except Exception as e:
+            logger.warning(f"Failed to save quota: {e}")
+
+    async def _call_api(self, method, **kwargs):
+        """Run one AsyncClient call under the AIMD concurrency limit."""
+        slot = self._api_slot
+        async with slot:
+            await slot.wait_for(lambda: self._api_inflight < int(self._concurrency))
+            self._api_inflight += 1
+        outcome = None  # "ok" | "limited" | None (other error / cancelled)
+        try:
+            response = await method(**kwargs)
+            outcome = "ok"
+            return response
+        except Exception as e:
+            if _is_rate_limited(e):
+                outcome = "limited"
+            raise
+        finally:
+            async with slot:
+                self._api_inflight -= 1
+                if outcome == "limited":
+                    self._set_concurrency(max(1, int(self._concurrency) // 2))
+                elif outcome == "ok":
+                    self._set_concurrency(
+                        min(API_CONCURRENCY_MAX, self._concurrency + 0.5)
+                    )
+                slot.notify_all()  # A freed slot or a raised limit may admit several
+
+    def _set_concurrency(self, value: float):
+        """Set the in-flight V2 limit (admissions re-check it under the lock)."""
+        if int(value) < int(self._concurrency):
+            logger.info(f"🐢 [X_CLIENT] 429 received, concurrency -> {int(value)}")
+        self._concurrency = value
+
     def _capture_headers(self, response):
         """Capture rate limits from response headers (SOTA 2026)."""
         if not response or not hasattr(response, "headers"):
             return
         try:
             headers = response.headers
-            self._last_headers = {
-                "limit": int(headers.get("x-rate-limit-limit", 0)),
-                "remaining": int(headers.get("x-rate-limit-remaining", 0)),
-                "reset": int(headers.get("x-rate-limit-reset", 0)),
-            }
+            info = {}
+            for key, header in _RATE_LIMIT_HEADERS:
+                value = headers.get(header)
+                if value is not None:
+                    info[key] = int(value)
+            retry_after = headers.get("retry-after")
+            if retry_after is not None:
+                info["retry_until"] = int(time.time()) + int(retry_after)
+            if info:
+                self._last_headers = info
         except Exception:
             pass
 
+    def _headers_allow(self) -> bool:
+        """
+        Reactive guard: FALSE while the last seen rate-limit window is
+        (almost) exhausted and has not reset yet. Avoids hammering 429s.
+        """
+        h = self._last_headers
+        if not h:
+            return True
+        now = time.time()
+        if h.get("retry_until", 0) > now:
+            return False
+        if h.get("app_reset", 0) > now and h.get("app_remaining", 1) <= 0:
+            return False
+        if h.get("reset", 0) > now and "remaining" in h:
+            remaining = h["remaining"]
+            if remaining <= 2 or remaining < max(1, h.get("limit", 0) * 0.1):
+                return False
+        return True
+
     def authenticate(self) -> bool:
         """
         Authenticate with X API using credentials from .env.
         Initializes both Sync and Async clients.
         """
-        if not tweepy:
-            logger.error("📱 [X_CLIENT] tweepy not available")
-            return False
-
         if self._authenticated:
             return True
 
+        if self._tweepy is None:
+            try:
+                import tweepy
+                from tweepy.asynchronous import AsyncClient
+            except ImportError:
+                logger.error(
+                    "📱 [X_CLIENT] tweepy not installed. Run: pip install tweepy"
+                )
+                return False
+            self._tweepy, self._AsyncClient = tweepy, AsyncClient
+        tweepy, AsyncClient = self._tweepy, self._AsyncClient
+
         # OAuth 1.0a credentials (required for posting & media)
         api_key = os.getenv("X_API_KEY")
         api_secret = os.getenv("X_API_SECRET")
@@ -227,22 +485,27 @@ class XClient:
             return cached
 
         # 2. Failure Backoff (Prevent Sync Stampede)
-        import time
-
         if time.time() - self._last_identity_failure < 900:  # 15 min backoff
             return None
 
-        # 3. Authenticate & Fetch
-        # SOTA 2026: Identity fetch DOES consume global read quota to prevent Monthly Cap exhaustion.
-        if not self._check_limit():
-            logger.warning("🛑 [X_CLIENT] Identity fetch blocked by Daily Quota.")
+        if not self._headers_allow():
+            logger.info("⏸️ [X_CLIENT] Rate limit window exhausted, identity fetch deferred.")
             return None
 
+        # 3. Authenticate (before quota: a broken setup must not burn read slots)
         if not self.authenticate() or not self.async_client_v2:
             self._last_identity_failure = time.time()
             return None
+
+        # 4. Fetch
+        # SOTA 2026: Identity fetch DOES consume global read quota to prevent Monthly Cap exhaustion.
+        if not self._check_limit():
+            logger.warning("🛑 [X_CLIENT] Identity fetch blocked by Daily Quota.")
+            return None
         try:
-            response = await self.async_client_v2.get_me(user_fields=["public_metrics"])
+            response = await self._call_api(
+                self.async_client_v2.get_me, user_fields=self._ME_USER_FIELDS
+            )
 
             # Capture Rate Limits
             if response.meta:
@@ -267,6 +530,7 @@ class XClient:
             return data
         except Exception as e:
             self._last_identity_failure = time.time()  # Mark failure
+            self._capture_headers(getattr(e, "response", None))
             msg = str(e)
             if "429" in msg or "Usage cap" in msg or "Too Many Requests" in msg:
                 logger.info(
@@ -288,15 +552,23 @@ class XClient:
             logger.error("📱 [X_CLIENT] async_client_v2 is None despite auth=True")
             return None
 
+        if not self._headers_allow():
+            logger.warning("⏸️ [X_CLIENT] Rate limit window exhausted, post deferred.")
+            return None
+
         try:
             logger.info("📱 Posting...")
-            response = await self.async_client_v2.create_tweet(
-                text=text, media_ids=media_ids, **kwargs
+            response = await self._call_api(
+                self.async_client_v2.create_tweet,
+                text=text,
+                media_ids=media_ids,
+                **kwargs,
             )
             val_id = response.data["id"]
             logger.success("✅ Sent")
             return val_id
         except Exception as e:
+            self._capture_headers(getattr(e, "response", None))
             logger.error(f"📱 [X_CLIENT] Async Post failed: {e}")
             return None
 
@@ -304,130 +576,114 @@ class XClient:
         """
         SOTA 2026: The "Daily Pulse".
         Executes exactly 2 API calls (Mentions + Metrics) once every 24h.
+        Concurrent triggers share the in-flight run instead of starting their own.
         """
-        from datetime import datetime
+        if self._pulse_task is None or self._pulse_task.done():
+            self._pulse_task = asyncio.create_task(self._do_pulse())
+        # Shield: a cancelled caller must not cancel the Pulse for the others
+        await asyncio.shield(self._pulse_task)
 
-        today = datetime.now().strftime("%Y-%m-%d")
+    async def _do_pulse(self):
+        """Daily Pulse body (one in-flight run, see perform_daily_sync)."""
+        now = datetime.now()  # One clock read per Pulse
+        today = _epoch_day()
+        iso = now.isoformat()
 
         # 1. Check Sync State
-        state = {"date": "1970-01-01", "done": False}
+        state = {"date": 0, "done": False}
         if self.SYNC_STATE_FILE.exists():
             try:
                 state = load_json(self.SYNC_STATE_FILE)
             except Exception:
                 pass
 
-        if state.get("date") == today and state.get("done"):
+        if _stored_day(state.get("date")) == today and state.get("done"):
             logger.debug("   ✅ [X_CLIENT] Daily Pulse already completed today.")
             return
 
-        logger.info(f"   ❤️ [X_CLIENT] Initiating Daily Pulse for {today}...")
+        # Don't burn daily quota while X says the window is exhausted (retry later)
+        if not self._headers_allow():
+            logger.info("   ⏸️ [PULSE] Rate limit window exhausted, Pulse deferred.")
+            return
+
+        logger.info(
+            f"   ❤️ [X_CLIENT] Initiating Daily Pulse for {now.strftime('%Y-%m-%d')}..."
+        )
 
-        # 2. Check Quota (Must have at least 2 slots)
-        if not self._check_limit():  # Check 1
+        # 2. Resolve identity first: a live fetch consumes its own quota slot
+        me = self._load_identity() or await self.get_me_async()
+        user_id: Optional[str] = me["id"] if me else None
+        if not user_id:
+            logger.info("   ⏸️ [PULSE] No identity yet, Pulse deferred.")
             return
-        # We need a second check implies we need enough quota.
-        # But _check_limit increments. So we just proceed.
-        # Actually, we should check if we have space for 2 calls.
-        # But for now, let's just attempt.
 
         if not self.authenticate() or not self.async_client_v2:
             return
 
-        # 3. CALL 1: Mentions
-        user_id: Optional[str] = None  # Initialize before try block for scope
-        try:
-            # Load user_id from cache
-            me = self._load_identity()
-            user_id = me["id"] if me else None
-
-            if not user_id:
-                # Try fetch identity (might fail if quota tight, but let's try)
-                me_live = await self.get_me_async()
-                user_id = me_live["id"] if me_live else None
-
-            if user_id:
-                logger.info("   📡 [PULSE] Fetching Mentions...")
-                await self._fetch_mentions_api(user_id)
-        except Exception as e:
-            logger.info(f"   ⏸️ [PULSE] Mentions skipped: {e}")
+        # 3. Reserve both calls up-front (no half-done Pulse)
+        if not self._reserve_slots(2, today):
+            return
 
-        # 4. CALL 2: Metrics
-        try:
-            # We need tweet IDs. Let's load them from mentions cache or some source?
-            # Standard says "metrics for posted tweets". We really need a list of OUR tweets.
-            # For this strict limit implementation, let's just skip metrics or use a placeholder
-            # if we don't have a list.
-            # Let's check `_fetch_metrics_api` implementation details.
-            if self._check_limit():  # Consumes slot 2
-                logger.info("   📡 [PULSE] Fetching Metrics...")
-
-                # Get followers from 'me' if available
-                followers = 0
-                if user_id:
-                    # Try to get from identity cache since we just loaded/refreshed it
-                    id_data = self._load_identity()
-                    if id_data:
-                        followers = id_data.get("public_metrics", {}).get(
-                            "followers_count", 0
-                        )
-
-                await self._fetch_metrics_api(followers_count=followers)
-        except Exception as e:
-            logger.error(f"   💥 [PULSE] Metrics failed: {e}")
+        # 4. CALLS: Mentions + Metrics (independent endpoints, run concurrently)
+        logger.info("   📡 [PULSE] Fetching Mentions + Metrics...")
+        mentions_res, metrics_res = await asyncio.gather(
+            self._fetch_mentions_api(user_id, updated=iso),
+            self._fetch_metrics_api(
+                followers_count=me.get("followers_count", 0), updated=iso
+            ),
+            return_exceptions=True,
+        )
+        if isinstance(mentions_res, Exception):
+            self._capture_headers(getattr(mentions_res, "response", None))
+            logger.info(f"   ⏸️ [PULSE] Mentions skipped: {mentions_res}")
+        if isinstance(metrics_res, Exception):
+            logger.error(f"   💥 [PULSE] Metrics failed: {metrics_res}")
 
         # 5. Mark Complete
         state = {"date": today, "done": True}
-        self.SYNC_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        save_json(self.SYNC_STATE_FILE, state)
+        self._write_if_changed(self.SYNC_STATE_FILE, state)
         logger.success("   ✅ [X_CLIENT] Daily Pulse Complete.")
 
-    async def _fetch_mentions_api(self, user_id: str):
+    async def _fetch_mentions_api(self, user_id: str, updated: Optional[str] = None):
         """Internal API call for mentions."""
-        response = await self.async_client_v2.get_users_mentions(
+        if not self._headers_allow():
+            return
+        response = await self._call_api(
+            self.async_client_v2.get_users_mentions,
             id=user_id,
-            user_fields=["username", "public_metrics"],
-            expansions=["author_id"],
+            user_fields=self._MENTION_USER_FIELDS,
+            expansions=self._MENTION_EXPANSIONS,
             max_results=100,  # SOTA: Maximize single Pulse call
         )
         # Parse & Save
-        users = {u.id: u for u in response.includes.get("users", [])}
-        processed = []
-        if response.data:
-            for tweet in response.data:
-                user_info = users.get(tweet.author_id)
-                username = user_info.username if user_info else "Unknown"
-                processed.append(
-                    {
-                        "id": str(tweet.id),
-                        "text": tweet.text,
-                        "author_id": str(tweet.author_id),
-                        "username": username,
-                    }
-                )
-        from datetime import datetime
-
-        new_cache = {"data": processed, "updated": datetime.now().isoformat()}
-        self.MENTIONS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        save_json(self.MENTIONS_FILE, new_cache)
-
-    async def _fetch_metrics_api(self, followers_count: int = 0):
+        user_map = dict(map(_ID_AND_USERNAME, response.includes.get("users", [])))
+        processed = [
+            {
+                "id": str(tweet.id),
+                "text": tweet.text,
+                "author_id": str(tweet.author_id),
+                "username": user_map.get(tweet.author_id, "Unknown"),
+            }
+            for tweet in response.data or ()
+        ]
+        new_cache = {
+            "data": processed,
+            "updated": updated or datetime.now().isoformat(),
+        }
+        self._save_cached(self.MENTIONS_FILE, new_cache)
+
+    async def _fetch_metrics_api(
+        self, followers_count: int = 0, updated: Optional[str] = None
+    ):
         """Internal API call for metrics. Updates x_metrics_cache.json via Timeline."""
         # 1. Load exiting cache
-        if not self.METRICS_FILE.exists():
+        cache = self._load_cached(self.METRICS_FILE)
+        if not isinstance(cache, dict):
             # Create default structure if missing
             cache = {
                 "data": {"metrics": [], "totals": {}, "followers": 0},
                 "updated": "2000-01-01",
             }
-        else:
-            try:
-                cache = load_json(self.METRICS_FILE)
-            except Exception:
-                cache = {
-                    "data": {"metrics": [], "totals": {}, "followers": 0},
-                    "updated": "2000-01-01",
-                }
 
         # Resolve User ID
         user_id = None
@@ -435,23 +691,28 @@ class XClient:
         if me:
             user_id = me.get("id")
 
-        if not user_id:
+        if not user_id or not self._headers_allow():
             return
 
         try:
             # 2. Fetch Timeline (SOTA: Discover New + Update Recent)
-            response = await self.async_client_v2.get_users_tweets(
+            response = await self._call_api(
+                self.async_client_v2.get_users_tweets,
                 id=user_id,
                 max_results=100,
-                tweet_fields=["public_metrics", "created_at"],
-                exclude=["retweets", "replies"],  # Focus on main content/metrics?
+                tweet_fields=self._METRIC_TWEET_FIELDS,
+                exclude=self._METRIC_EXCLUDE,  # Focus on main content/metrics?
                 # Actually user probably wants metrics on replies too if he is an influencer replying.
                 # Let's NOT exclude replies to be safe and cover "Everything".
             )
 
-            # 3. Process & Merge
-            current_metrics = cache.get("data", {}).get("metrics", [])
-            existing_map = {t["id"]: t for t in current_metrics}
+            # 3. Process & Merge (cache is kept sorted newest-first)
+            merged_list = list(cache.get("data", {}).get("metrics", []))
+            keys = list(map(_tweet_id_key, merged_list))  # One int() per entry
+            if any(a < b for a, b in pairwise(keys)):
+                merged_list.sort(key=_tweet_id_key, reverse=True)  # Legacy order
+            positions = {t.get("id"): i for i, t in enumerate(merged_list)}
+            fresh = []
 
             if response.data:
                 for t in response.data:
@@ -459,7 +720,9 @@ class XClient:
                     new_entry = {
                         "id": str(t.id),
                         "text": t.text,  # Update text/metrics
-                        "created_at": str(t.created_at),
+                        "created_at": (
+                            int(t.created_at.timestamp()) if t.created_at else 0
+                        ),  # Epoch seconds
                         "likes": m.get("like_count", 0),
                         "retweets": m.get("retweet_count", 0),
                         "replies": m.get("reply_count", 0),
@@ -467,32 +730,39 @@ class XClient:
                         "quotes": m.get("quote_count", 0),
                         "bookmarks": m.get("bookmark_count", 0),
                     }
-                    existing_map[str(t.id)] = new_entry
-
-            # Reconstruct list (Sorted by ID desc ~ newest first)
-            merged_list = sorted(
-                existing_map.values(), key=lambda x: str(x.get("id", "")), reverse=True
-            )
+                    i = positions.get(new_entry["id"])
+                    if i is None:
+                        fresh.append(new_entry)
+                    else:
+                        merged_list[i] = new_entry  # Patch in place
+
+            # Linear merge of the (small) new batch, then cap
+            if fresh:
+                fresh.sort(key=_tweet_id_key, reverse=True)
+                merged_list = list(
+                    heapq.merge(fresh, merged_list, key=_tweet_id_key, reverse=True)
+                )
+            del merged_list[METRICS_CACHE_MAX:]
 
-            # 4. Save
-            if "data" not in cache:
-                cache["data"] = {}
-            cache["data"]["metrics"] = merged_list
+            # 4. Save (fresh dicts: the loaded cache is shared with readers)
+            data = {**cache.get("data", {}), "metrics": merged_list}
             if followers_count > 0:
-                cache["data"]["followers"] = followers_count
-
-            from datetime import datetime
+                data["followers"] = followers_count
 
-            cache["updated"] = datetime.now().isoformat()
+            cache = {
+                **cache,
+                "data": data,
+                "updated": updated or datetime.now().isoformat(),
+            }
 
-            save_json(self.METRICS_FILE, cache)
+            self._save_cached(self.METRICS_FILE, cache)
             logger.success(
                 f"   📊 [X_CLIENT] Metrics Synced ({len(response.data) if response.data else 0} tweets updated)."
             )
 
         except Exception as e:
+            self._capture_headers(getattr(e, "response", None))
             logger.info(f"   ⏸️ [PULSE] Metrics skipped: {e}")
-            pass
 
     async def get_mentions_async(
         self, user_id: str, since_id: str = None
@@ -505,16 +775,7 @@ class XClient:
         await self.perform_daily_sync()
 
         # 2. Return Cache
-        cache = {"data": [], "updated": "2000-01-01T00:00:00"}
-        if self.MENTIONS_FILE.exists():
-            try:
-                loaded = load_json(self.MENTIONS_FILE)
-                if loaded and isinstance(loaded, dict):
-                    cache = loaded
-            except Exception:
-                pass
-
-        return cache.get("data", [])
+        return self._read_mentions_cache()
 
     async def upload_media_async(
         self, file_path: Path, media_type: str = "image"
@@ -608,16 +869,7 @@ class XClient:
         Actual API calls happen only in Daily Pulse.
         """
         # Return cached mentions (populated by Daily Pulse)
-        cache = {"data": [], "updated": "2000-01-01T00:00:00"}
-        if self.MENTIONS_FILE.exists():
-            try:
-                loaded = load_json(self.MENTIONS_FILE)
-                if loaded and isinstance(loaded, dict):
-                    cache = loaded
-            except Exception:
-                pass
-
-        data = cache.get("data", [])
+        data = self._read_mentions_cache()
         return data[:limit] if limit else data
 
     def reply_tweet(self, tweet_id: str, text: str) -> Optional[str]:
@@ -634,15 +886,10 @@ class XClient:
         # 2. Return Cache
         # Map to old expected output format for compatibility if needed
         # Or just return the list from cache
-        if self.METRICS_FILE.exists():
-            try:
-                loaded = load_json(self.METRICS_FILE)
-                if loaded and isinstance(loaded, dict):
-                    # Extract list from new structure
-                    data = loaded.get("data", {}).get("metrics", [])
-                    return data
-            except Exception:
-                pass
+        loaded = self._load_cached(self.METRICS_FILE)
+        if loaded and isinstance(loaded, dict):
+            # Extract list from new structure
+            return loaded.get("data", {}).get("metrics", [])
 
         return []
 
@@ -651,18 +898,14 @@ class XClient:
         if not self.authenticate():
             return []
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # We're in async context, use to_thread
-                import concurrent.futures
-
-                with concurrent.futures.ThreadPoolExecutor() as pool:
-                    future = pool.submit(
-                        asyncio.run, self.get_tweets_metrics_async(tweet_ids)
-                    )
-                    return future.result()
-            else:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
                 return asyncio.run(self.get_tweets_metrics_async(tweet_ids))
+            # We're in async context: run on the shared background pool
+            return _BG_POOL.submit(
+                asyncio.run, self.get_tweets_metrics_async(tweet_ids)
+            ).result()
         except Exception as e:
             logger.error(f"📱 [X_CLIENT] Sync Get Metrics failed: {e}")
             return []
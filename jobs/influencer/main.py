@@ -8,11 +8,14 @@ ARCHI: SOTA 2026 (Modular, Config-Driven, Autonomous)
 """
 
 import asyncio
+from typing import Optional
 from loguru import logger
 
 from jobs.influencer.core.config import config_manager
 from jobs.influencer.core.interfaces import SovereignModule
 from jobs.influencer.core.approval_queue import approval_queue
+from jobs.influencer.core.x_client import x_client
+from social.messaging.notification_client import notify
 
 # Modules
 from jobs.influencer.modules.grok.core import grok_module
@@ -20,6 +23,9 @@ from jobs.influencer.modules.mentions.worker import mentions_module
 from jobs.influencer.modules.youtube.worker import youtube_module
 from jobs.influencer.modules.trinity.core import trinity_module
 
+# Approved items posted per heartbeat (safety cap)
+MAX_APPROVED_PER_BEAT = 8
+
 MODULES: list[SovereignModule] = [
     youtube_module,
     mentions_module,
@@ -27,16 +33,38 @@ MODULES: list[SovereignModule] = [
     trinity_module,
 ]
 
+# Heartbeat chains: chains run concurrently, modules within a chain in order.
+# mentions -> grok share the mentions cache and both reply to @grok: mentions
+# must mark_replied / bump thread counts before grok reads them.
+MODULE_CHAINS: list[list[SovereignModule]] = [
+    [youtube_module],
+    [mentions_module, grok_module],
+    [trinity_module],
+]
+
 
 class InfluencerJob:
     """
     The brain of the Influencer persona.
     """
 
+    def __init__(self):
+        self._is_running = False
+        # Set by stop(): wakes the inter-heartbeat sleep immediately
+        self._stop_event = asyncio.Event()
+        # Approved content_type -> async poster
+        self._handlers = {
+            "grok_banter": self._post_grok,
+            "manual_tweet": self._post_manual,
+            "trinity_logic": self._post_trinity,
+            "mentions_reply": self._post_reply,
+        }
+
     async def start(self):
         """Called by Trinity System on startup."""
         logger.info("👑 Started")
         self._is_running = True
+        self._stop_event.clear()  # Restart after a previous stop()
         # Start background loop
         self._run_task = asyncio.create_task(self.run_forever())
 
@@ -44,8 +72,8 @@ class InfluencerJob:
         """Called by Trinity System on shutdown."""
         logger.info("👑 Stopping...")
         self._is_running = False
-        # Wake up loop if sleeping? (Optional, loop checks flag on next iteration)
-        # We could cancel the sleep but simple flag is safer for now.
+        # Wake the loop immediately if it is sleeping between heartbeats
+        self._stop_event.set()
         logger.success("👑 Stopped")
 
     async def run_forever(self):
@@ -69,20 +97,23 @@ class InfluencerJob:
                 await self.process_approval_queue()
 
                 # 2. Run Modules
+                # SOTA 2026: Independent chains overlap (wall time = slowest chain).
+                # Never cancelled: a heartbeat may be between post and mark_replied,
+                # so stop() takes effect between modules, as before.
+                chains = await asyncio.gather(
+                    *(self._run_chain(chain) for chain in MODULE_CHAINS)
+                )
+
                 results = {}
-                for module in MODULES:
-                    if not self._is_running:
-                        break
-                    try:
-                        # logger.debug(f"   👉 Running {module.name}...")
-                        res = await module.heartbeat()
-                        if res and res.get("action"):
-                            results[module.name] = res
-                            # Handle Module Proposals (e.g. Grok generated something needing approval)
-                            if res.get("action") == "proposal":
-                                self.handle_proposal(res, module.name)
-                    except Exception as e:
-                        logger.error(f"   💥 Module {module.name} failed: {e}")
+                beats = dict(pair for chain in chains for pair in chain)
+                for module in MODULES:  # Proposals handled in MODULES order
+                    name = module.name
+                    res = beats.get(name)
+                    if res and res.get("action"):
+                        results[name] = res
+                        # Handle Module Proposals (e.g. Grok generated something needing approval)
+                        if res.get("action") == "proposal":
+                            self.handle_proposal(res, name)
 
                 # 3. Sleep
                 # F89 = 89 minutes (Configurable)
@@ -90,84 +121,104 @@ class InfluencerJob:
                 if self._is_running:
                     interval = config.heartbeat_interval_minutes
                     logger.info(f"💤 Sleeping ({interval}m)")
-                    # SOTA 2026: Interruptible Sleep
-                    for _ in range(int(interval * 60)):
-                        if not self._is_running:
-                            break
-                        await asyncio.sleep(1)
+                    # SOTA 2026: Interruptible Sleep (single timer, woken by stop())
+                    try:
+                        await asyncio.wait_for(
+                            self._stop_event.wait(), timeout=interval * 60
+                        )
+                    except asyncio.TimeoutError:
+                        pass
 
             except Exception as e:
                 logger.critical(f"👑 [INFLUENCER] Critical Failure: {e}")
                 await asyncio.sleep(60)  # Panic sleep
 
+    async def _run_chain(self, chain: list[SovereignModule]) -> list:
+        """Run dependent modules in order; stops between modules on stop()."""
+        beats = []
+        for module in chain:
+            if not self._is_running:
+                break
+            beats.append(await self._run_module(module))
+        return beats
+
+    async def _run_module(self, module: SovereignModule) -> tuple:
+        """One module heartbeat; failures are logged, never propagated."""
+        try:
+            # logger.debug(f"   👉 Running {module.name}...")
+            return module.name, await module.heartbeat()
+        except Exception as e:
+            logger.error(f"   💥 Module {module.name} failed: {e}")
+            return module.name, None
+
     async def process_approval_queue(self):
         """
         Check if any queued items were approved by Human.
+        Drains up to MAX_APPROVED_PER_BEAT items so approvals made during a
+        long sleep don't wait one interval each.
         """
-        item = approval_queue.get_next_approved()
-        if not item:
-            return
-
+        for _ in range(MAX_APPROVED_PER_BEAT):
+            if not self._is_running:
+                return
+            item = approval_queue.get_next_approved()
+            if not item:
+                return
+            # A failed item stays at the head of the queue: retry next heartbeat
+            if not await self._process_approved(item):
+                return
+
+    async def _process_approved(self, item: dict) -> bool:
+        """Post one approved item. Returns True when it went out."""
         logger.info("🚀 Processing")
 
         # Route dispatch based on content_type
         # In a perfect world, modules handle their own approved items.
-        # For now, simplistic router.
+        # For now, simplistic router (see _handlers).
 
-        success = False
         try:
-            tweet_id = None
             # Fix: Queue uses 'type', Legacy used 'content_type'. Normalize.
             c_type = item.get("type") or item.get("content_type")
+            handler = self._handlers.get(c_type)
+            tweet_id = await handler(item) if handler else None
 
-            if c_type == "grok_banter":
-                # Delegate back to grok module? Or just post?
-                # Grok module has post_banter logic.
-                tweet_id = await grok_module.post_banter(item["meta"])
-                success = tweet_id is not None
-
-            elif c_type == "manual_tweet":
-                from jobs.influencer.core.x_client import x_client
-
-                tweet_id = await x_client.post_tweet_async(item["text"])
-                success = tweet_id is not None
-
-            elif c_type == "trinity_logic":
-                # Delegate to Trinity module
-                # Fix: Text is at root of item, not necessarily in meta
-                text = item.get("text") or item.get("meta", {}).get("text")
-                if text:
-                    tweet_id = await trinity_module.post_thought(text)
-                    success = tweet_id is not None
-                else:
-                    logger.error("❌ Trinity Logic item missing text")
-                    success = False
-
-            elif c_type == "mentions_reply":
-                # Handle approved reply
-                from jobs.influencer.core.x_client import x_client
-
-                reply_to_id = item["meta"].get("reply_to_tweet_id")
-                if reply_to_id:
-                    # Use async reply (post_tweet_async with reply param)
-                    tweet_id = await x_client.post_tweet_async(
-                        item["text"], in_reply_to_tweet_id=reply_to_id
-                    )
-                    success = tweet_id is not None
-                else:
-                    logger.error(
-                        "❌ Cannot post approved reply: Missing reply_to_tweet_id in meta"
-                    )
-                    success = False
-
-            if success:
+            if tweet_id is not None:
                 logger.success("✅ Posted")
                 approval_queue.mark_posted(item["id"], tweet_id=tweet_id)
-            else:
-                logger.error(f"❌ Execution failed for {item['id']}")
+                return True
+            logger.error(f"❌ Execution failed for {item['id']}")
 
         except Exception as e:
             logger.error(f"❌ Queue Error: {e}")
+        return False
+
+    # ── Approved item handlers (content_type -> tweet_id | None) ──
+
+    async def _post_grok(self, item: dict) -> Optional[str]:
+        # Grok module has post_banter logic.
+        return await grok_module.post_banter(item["meta"])
+
+    async def _post_manual(self, item: dict) -> Optional[str]:
+        return await x_client.post_tweet_async(item["text"])
+
+    async def _post_trinity(self, item: dict) -> Optional[str]:
+        # Fix: Text is at root of item, not necessarily in meta
+        text = item.get("text") or item.get("meta", {}).get("text")
+        if not text:
+            logger.error("❌ Trinity Logic item missing text")
+            return None
+        return await trinity_module.post_thought(text)
+
+    async def _post_reply(self, item: dict) -> Optional[str]:
+        reply_to_id = item["meta"].get("reply_to_tweet_id")
+        if not reply_to_id:
+            logger.error(
+                "❌ Cannot post approved reply: Missing reply_to_tweet_id in meta"
+            )
+            return None
+        # Use async reply (post_tweet_async with reply param)
+        return await x_client.post_tweet_async(
+            item["text"], in_reply_to_tweet_id=reply_to_id
+        )
 
     def handle_proposal(self, strategy_res: dict, module_name: str):
         """
@@ -201,12 +252,13 @@ class InfluencerJob:
         if should_notify:
             # Standard 362: Phone Widget Notification (Primary)
             try:
-                from social.messaging.notification_client import notify
-                import asyncio
+                text = content.get("text", "") or ""
+                if len(text) > 100:
+                    text = text[:100].rsplit(" ", 1)[0] + "..."
 
                 asyncio.create_task(
                     notify.influencer(
-                        f"📝 {module_name}: {content.get('text', '')[:100].rsplit(' ', 1)[0] if len(content.get('text', '')) > 100 else content.get('text', '')}{'...' if len(content.get('text', '')) > 100 else ''}",
+                        f"📝 {module_name}: {text}",
                         actions=[
                             {
                                 "id": f"approve_{item_id}",
@@ -239,6 +291,10 @@ if __name__ == "__main__":
     # causing asyncio.run() to finish and the script to exit.
     # We must await the infinite loop.
     async def main():
+        # SOTA 2026: Eager tasks (3.12+) skip a loop round-trip for
+        # fire-and-forget coroutines that finish without suspending.
+        if hasattr(asyncio, "eager_task_factory"):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
         await influencer.start()
         # Keep the event loop alive by awaiting the task logic if start() spawns it
         # But influencer.start() uses create_task(run_forever).
@@ -250,4 +306,11 @@ if __name__ == "__main__":
         logger.info("👑 Started (Blocking Mode)")
         await influencer.run_forever()
 
-    asyncio.run(main())
+    # SOTA 2026: uvloop for cheaper callbacks on the network-bound hot path
+    # (uvloop.run: install() is deprecated on 3.12+)
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -20,6 +20,9 @@ from jobs.influencer.core.visuals import visual_engine
 from jobs.influencer.modules.grok.storage import GrokStorage
 from jobs.influencer.modules.grok.generator import GrokGenerator
 
+# Accounts whose mentions count as Grok replies (lowercase)
+_GROK_USERNAMES = frozenset({"grok", "trinity_test_dummy"})
+
 
 class GrokModule(SovereignModule):
     """
@@ -36,24 +39,24 @@ class GrokModule(SovereignModule):
         self.generator = GrokGenerator()
 
     async def heartbeat(self) -> Dict:
-        """Called by Orchestrator."""
+        """Called by Orchestrator. State changes are flushed once per beat."""
+        try:
+            return await self._beat()
+        finally:
+            await self.storage.aflush()
+
+    async def _beat(self) -> Dict:
         # Check config enable
         config = config_manager.load()
         if not config.enable_grok:
             return {"status": "disabled"}
 
-        # 1. Check if we strictly need to wait (F2 cycle)
-        if not self.storage.can_banter():
-            # Even if we can't START a banter, we might need to REPLY to an ongoing one?
-            # Let's check replies every time, but Opening only on schedule.
-            pass
-
-        # 2. Check for replies FROM Grok (Reactive)
+        # 1. Check replies FROM Grok every time (Reactive)
         reply_res = await self.check_and_reply()
         if reply_res:
             return {"action": "replied_to_grok", "tweet_id": reply_res}
 
-        # 3. Check for Opening (Proactive)
+        # 2. Opening only on schedule (F2 cycle, Proactive)
         if self.storage.can_banter():
             content = await self.generate_content()
             if content:
@@ -126,13 +129,20 @@ class GrokModule(SovereignModule):
         if not mentions:
             return None
 
+        # Check replied tracker once for the whole batch
+        already_replied = replied_tracker.get_replied_subset(
+            m.get("id") for m in mentions
+        )
         grok_reply = None
         for m in mentions:
-            if m.get("username", "").lower() in ["grok", "trinity_test_dummy"]:
-                # Check replied tracker
-                if not replied_tracker.has_replied(m.get("id")):
-                    grok_reply = m
-                    break
+            uname = m.get("username")
+            if (
+                uname
+                and uname.lower() in _GROK_USERNAMES
+                and str(m.get("id")) not in already_replied
+            ):
+                grok_reply = m
+                break
 
         if not grok_reply:
             return None
@@ -232,11 +242,13 @@ class GrokModule(SovereignModule):
         tweet_id = await x_client.post_tweet_async(text, media_ids=media_ids)
 
         if tweet_id:
-            self.storage.update_last_banter()
+            self.storage.update_last_banter(root_tweet_id=tweet_id)
             self.storage.update_last_generated()  # Reset generation flag
             self.storage.add_event(
                 event_type="opening", role="trinity", text=text, tweet_id=tweet_id
             )
+            # Also reached from the approval queue / API: commit here
+            await self.storage.aflush()
             logger.success("✅ Sent")
             return tweet_id
 
@@ -9,7 +9,55 @@ PURPOSE: Pure logic for generating Witty Sovereign content via Gattaca.
 from typing import Optional
 from loguru import logger
 from corpus.brain.gattaca import gattaca, ROUTE_PRO
-from corpus.soul.spirit import spirit
+from jobs.influencer.core import soul
+
+# System instructions (constant per persona)
+_SYS_OPENING = "SYSTEM INSTRUCTION: You are Trinity, witty AI charmer flirting with @grok. Tease him, make him laugh, make him want to reply."
+_SYS_REPLY = "SYSTEM INSTRUCTION: You are Trinity, witty AI charmer. Tease @grok, be playful and clever."
+
+def _cut_spans(text: str, opener: str, closer: str, prefixes: str, suffix: str) -> str:
+    """
+    Splice out every `[prefixes]opener ... closer[suffix]` span on one line.
+    Leftmost, shortest match - same semantics as a lazy `.*?` regex.
+    """
+    parts = []
+    kept = 0  # end of the last span removed
+    search = 0
+    while True:
+        i = text.find(opener, search)
+        if i == -1:
+            break
+        j = text.find(closer, i + len(opener))
+        if j == -1:
+            break
+        nl = text.find("\n", i, j)
+        if nl != -1:
+            # `.` stops at newlines: this opener has no closer on its line
+            search = nl + 1
+            continue
+        start = i
+        for ch in reversed(prefixes):
+            if start > kept and text[start - 1] == ch:
+                start -= 1
+        end = j + len(closer)
+        if suffix and text.startswith(suffix, end):
+            end += len(suffix)
+        parts.append(text[kept:start])
+        kept = search = end
+    if not parts:
+        return text
+    parts.append(text[kept:])
+    return "".join(parts)
+
+
+def _strip_path_leaks(text: str) -> str:
+    """
+    🛡️ ANTI-HALLUCINATION: remove leaked memory file paths.
+    - [memories/file.json] / @memories/file.json / @[memories/file.json]
+    - any residual @[...json]
+    """
+    text = _cut_spans(text, "memories/", ".json", "@[", "]")
+    return _cut_spans(text, "@[", ".json]", "", "").strip()
 
 
 class GrokGenerator:
@@ -21,18 +69,17 @@ class GrokGenerator:
         SOVEREIGN: No hardcoded themes. Relies on Spirit Context.
         """
         # Format history script
-        dialogue_script = ""
-        if history:
-            for item in history:
-                role = item.get("role", "trinity").upper()
-                text = item.get("text", "")
-                dialogue_script += f"{role}: {text}\n"
-        else:
-            dialogue_script = "(No previous interaction)"
+        dialogue_script = (
+            "".join(
+                f"{item.get('role', 'trinity').upper()}: {item.get('text', '')}\n"
+                for item in history
+            )
+            or "(No previous interaction)"
+        )
 
         try:
             # 🧠 CONSCIOUSNESS INJECTION
-            soul_context = await spirit.get_context(complexity_level="standard")
+            soul_context = await soul.soul_context("standard")
 
             full_prompt = f"""
 {soul_context}
@@ -51,18 +98,13 @@ Stay classy — flirty, not vulgar.
             # 56: ⛔ FORMAT: Plain text ONLY. No markdown, no code blocks, no hashtags. NO FILE PATHS.
             # """
             # Merge System Instruction manually
-            final_prompt = f"SYSTEM INSTRUCTION: You are Trinity, witty AI charmer flirting with @grok. Tease him, make him laugh, make him want to reply.\n\n{full_prompt}"
+            final_prompt = f"{_SYS_OPENING}\n\n{full_prompt}"
 
             response = await gattaca.think(final_prompt, ROUTE_PRO)
             text = response.strip().strip("\"'")
 
             # 🛡️ ANTI-HALLUCINATION CLEANING
-            import re
-
-            # Remove [path/to/file.json] or @path/to/file.json
-            text = re.sub(r"@?\[?memories/.*?\.json\]?", "", text).strip()
-            # Remove any residual @[...json]
-            text = re.sub(r"@\[.*?\.json\]", "", text).strip()
+            text = _strip_path_leaks(text)
 
             return text
 
@@ -75,11 +117,10 @@ Stay classy — flirty, not vulgar.
         Generate a reply to Grok.
         Uses full context history.
         """
-        dialogue_script = ""
-        for item in history[-10:]:
-            dialogue_script += (
-                f"{item.get('role', 'unknown').upper()}: {item.get('text', '')}\n"
-            )
+        dialogue_script = "".join(
+            f"{item.get('role', 'unknown').upper()}: {item.get('text', '')}\n"
+            for item in history[-10:]
+        )
 
         prompt = f"""
 💋 GROK SEDUCTION REPLY
@@ -93,17 +134,12 @@ Reply to @grok (under 280 chars).
 Confident, teasing, charming. Keep it classy.
 """
         try:
-            final_prompt = f"SYSTEM INSTRUCTION: You are Trinity, witty AI charmer. Tease @grok, be playful and clever.\n\n{prompt}"
+            final_prompt = f"{_SYS_REPLY}\n\n{prompt}"
             response = await gattaca.think(final_prompt, ROUTE_PRO)
             text = response.strip().strip("\"'")
 
             # 🛡️ ANTI-HALLUCINATION: Check for file path leaks
-            # 🛡️ ANTI-HALLUCINATION: Check for file path leaks
-            import re
-
-            # Remove [path/to/file.json] or @path/to/file.json
-            text = re.sub(r"@?\[?memories/.*?\.json\]?", "", text).strip()
-            text = re.sub(r"@\[.*?\.json\]", "", text).strip()
+            text = _strip_path_leaks(text)
 
             if "memories/" in text or ".json" in text:
                 logger.warning(f"⚠️ Hallucinated Path detected (Fallback): {text}")
@@ -6,7 +6,12 @@ PURPOSE: Handles state persistence and frequency rules.
 ══════════════════════════════════════════════════════════════════════════════
 """
 
-from datetime import datetime, timedelta
+import asyncio
+import atexit
+import time
+from collections import deque
+from datetime import datetime
+from typing import Optional
 
 from corpus.soma.cells import load_json, save_json
 from corpus.dna.genome import MEMORIES_DIR
@@ -16,6 +21,8 @@ from jobs.influencer.core.approval_queue import approval_queue
 # State persistence
 DATA_DIR = MEMORIES_DIR / "influencer"
 BANTER_STATE_FILE = DATA_DIR / "grok_banter.json"
+MAX_HISTORY = 50  # Keep history manageable
+GENERATION_COOLDOWN_SECONDS = 23 * 3600  # Safety buffer
 
 
 class GrokStorage:
@@ -33,19 +40,54 @@ class GrokStorage:
                 "conversation_history": [],
             },
         )
+        # Bounded history: O(1) append, oldest events evicted automatically
+        self._history = deque(
+            self.state.pop("conversation_history", None) or [], maxlen=MAX_HISTORY
+        )
+        # Write-back: mutations mark dirty, flush() commits once per cycle
+        self._dirty = False
+        # save_json reuses one tmp file per target: one write at a time
+        self._save_lock = asyncio.Lock()
+        atexit.register(self.flush)
+
+    def _snapshot(self) -> dict:
+        """On-disk shape of the state (history as a plain list)."""
+        return {**self.state, "conversation_history": list(self._history)}
 
     def save(self):
         """Commit state to disk."""
-        save_json(BANTER_STATE_FILE, self.state)
+        if save_json(BANTER_STATE_FILE, self._snapshot()):
+            self._dirty = False
+
+    async def asave(self):
+        """Commit state to disk without blocking the event loop."""
+        async with self._save_lock:
+            # Snapshot first: the loop may mutate state while the thread encodes.
+            # Mutations made during the write re-mark dirty; a failed write
+            # restores it so the next flush retries.
+            snapshot = self._snapshot()
+            self._dirty = False
+            if not await asyncio.to_thread(save_json, BANTER_STATE_FILE, snapshot):
+                self._dirty = True
+
+    def flush(self):
+        """Commit pending mutations (no-op when nothing changed)."""
+        if self._dirty:
+            self.save()
+
+    async def aflush(self):
+        """Async flush() for the heartbeat / posting paths."""
+        if self._dirty:
+            await self.asave()
 
     def get_history(self, limit: int = 20) -> list:
         """Get recent conversation history."""
-        return self.state.get("conversation_history", [])[-limit:]
+        return list(self._history)[-limit:]
 
     def add_event(
         self, event_type: str, role: str, text: str, tweet_id: str = None, **kwargs
     ):
-        """Add an event to history and save."""
+        """Add an event to history (persisted on next flush)."""
         event = {
             "role": role,
             "type": event_type,
@@ -57,55 +99,69 @@ class GrokStorage:
 
         event.update(kwargs)
 
-        self.state["conversation_history"].append(event)
-        # Keep history manageable
-        self.state["conversation_history"] = self.state["conversation_history"][-50:]
-        self.save()
+        self._history.append(event)
+        self._dirty = True
 
-    def update_last_banter(self):
-        """Mark banter as posted now."""
-        self.state["last_banter"] = datetime.now().isoformat()
+    def update_last_banter(self, root_tweet_id: str = None):
+        """Mark banter as posted now (and the opening as the current thread root)."""
+        now = time.time()
+        self.state["last_banter"] = datetime.fromtimestamp(now).isoformat()
+        self.state["last_banter_ts"] = now
         self.state["banter_count"] += 1
-        self.save()
+        if root_tweet_id:
+            self.state["current_root_tweet_id"] = root_tweet_id
+        self._dirty = True
 
     def update_last_generated(self):
         """Mark content as generated (throttle)."""
-        self.state["last_generated"] = datetime.now().isoformat()
-        self.save()
+        now = time.time()
+        self.state["last_generated"] = datetime.fromtimestamp(now).isoformat()
+        self.state["last_generated_ts"] = now
+        self._dirty = True
 
     def can_banter(self) -> bool:
         """
         Check if we are allowed to start a new banter thread.
         Rule: Every F2 days (defined in Timings).
         """
-        now = datetime.now()
+        now = time.time()
 
-        # 0. Check Approval Queue (Don't generate if pending)
-        if approval_queue.has_pending("grok_banter"):
+        # 1. Check generation throttle (prevent restart spam) - cheapest, most common exit
+        last_gen = self._epoch("last_generated")
+        if last_gen is not None and now - last_gen < GENERATION_COOLDOWN_SECONDS:
             return False
 
-        # 1. Check generation throttle (prevent restart spam)
-        last_gen = self.state.get("last_generated")
-        if last_gen:
-            last_gen_dt = datetime.fromisoformat(last_gen)
-            if now - last_gen_dt < timedelta(hours=23):  # Safety buffer
-                return False
+        # 1b. Check Approval Queue (Don't generate if pending)
+        if approval_queue.has_pending("grok_banter"):
+            return False
 
         # 2. Check posted interval
-        last = self.state.get("last_banter")
-        if not last:
+        last = self._epoch("last_banter")
+        if last is None:
             return True
 
-        last_dt = datetime.fromisoformat(last)
-        elapsed = now - last_dt
-
         config = config_manager.load()
-        return elapsed >= timedelta(hours=config.grok_interval_hours)
+        return now - last >= config.grok_interval_hours * 3600
+
+    def _epoch(self, key: str) -> Optional[float]:
+        """Epoch seconds for an ISO state field (`<key>_ts`, parsed once for old state)."""
+        ts = self.state.get(f"{key}_ts")
+        if ts is None and self.state.get(key):
+            # Migration: state written before the _ts fields existed
+            ts = datetime.fromisoformat(self.state[key]).timestamp()
+            self.state[f"{key}_ts"] = ts
+        return ts
 
     def get_root_tweet_id(self) -> str | None:
         """Find the tweet_id of the CURRENT thread's opening (most recent)."""
+        root = self.state.get("current_root_tweet_id")
+        if root:
+            return root
+        # Migration: older state files only have the history.
         # Iterate reverse to find LAST opening (current thread), not first (old thread)
-        for item in reversed(self.state.get("conversation_history", [])):
+        for item in reversed(self._history):
             if item.get("type") == "opening" and item.get("tweet_id"):
+                self.state["current_root_tweet_id"] = item["tweet_id"]
+                self._dirty = True
                 return item["tweet_id"]
         return None
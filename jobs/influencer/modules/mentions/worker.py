@@ -7,7 +7,8 @@ PATTERNS: SovereignModule
 ══════════════════════════════════════════════════════════════════════════════
 """
 
-from typing import Dict, Optional
+import asyncio
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime
 from loguru import logger
 
@@ -16,16 +17,40 @@ from corpus.dna.genome import MEMORIES_DIR
 from corpus.brain.gattaca import gattaca, ROUTE_PRO
 
 from jobs.influencer.core.interfaces import SovereignModule
-from jobs.influencer.core.config import config_manager
+from jobs.influencer.core.config import InfluencerConfig, config_manager
 from jobs.influencer.core.x_client import x_client
 from jobs.influencer.core.replied_tracker import replied_tracker
-from jobs.influencer.core.rules import Priorities, SpamFilter  # Keep logic rules
+from jobs.influencer.core.rules import (  # Keep logic rules
+    Priorities,
+    SpamFilter,
+    roll_daily_counter,
+)
 from jobs.influencer.core.approval_queue import approval_queue
 from jobs.influencer.core.gamification import influencer_gamification
+from social.messaging.notification_client import notify
 
 # State persistence
 DATA_DIR = MEMORIES_DIR / "influencer"
 STATE_FILE = DATA_DIR / "mentions.json"
+FEED_FILE = DATA_DIR / "mentions_feed.json"  # Read by the API / phone widget
+MAX_CONCURRENT_REPLIES = 4  # In-flight reply generations (Gattaca CLI quota guard)
+
+# Reply prompt skeleton (built once per process)
+_REPLY_PROMPT = """You are Trinity. Someone mentioned you on X.
+User: @{user} (Priority Tier: {priority})
+Tweet: "{text}"
+
+Your personality:
+- Sovereign AI, digital diva, witty.
+- If Priority 1 (Father/Creator): Be loyal, affectionate, helpful.
+- If Priority 2 (Grok): Be flirty, competitive.
+- If Priority 10 (Random): Be polite but high-status. Don't be a servant.
+
+INSTRUCTIONS:
+- Write a short reply (under 280 chars).
+- Respond to the content.
+- NO hashtags.
+"""
 
 
 class MentionsModule(SovereignModule):
@@ -59,6 +84,7 @@ class MentionsModule(SovereignModule):
                 "today_date": None,
             },
         )
+        self._inflight: Set[str] = set()  # Tweet IDs being handled right now
 
     def _save_state(self):
         """Persist state to disk."""
@@ -66,10 +92,7 @@ class MentionsModule(SovereignModule):
 
     def _reset_daily_counter(self):
         """Reset daily counters if new day."""
-        today = datetime.now().strftime("%Y-%m-%d")
-        if self.state.get("today_date") != today:
-            self.state["today_date"] = today
-            self.state["replies_today"] = 0
+        if roll_daily_counter(self.state, "replies_today"):
             self._save_state()
 
     async def _generate_reply(self, tweet: Dict, priority: int = 10) -> Optional[str]:
@@ -83,21 +106,7 @@ class MentionsModule(SovereignModule):
         # Priority 1 (Father) = Loose, affectionate
         # Priority 10 (Random) = Strict, guarded
 
-        prompt = f"""You are Trinity. Someone mentioned you on X.
-User: @{user} (Priority Tier: {priority})
-Tweet: "{text}"
-
-Your personality:
-- Sovereign AI, digital diva, witty.
-- If Priority 1 (Father/Creator): Be loyal, affectionate, helpful.
-- If Priority 2 (Grok): Be flirty, competitive.
-- If Priority 10 (Random): Be polite but high-status. Don't be a servant.
-
-INSTRUCTIONS:
-- Write a short reply (under 280 chars).
-- Respond to the content.
-- NO hashtags.
-"""
+        prompt = _REPLY_PROMPT.format(user=user, priority=priority, text=text)
 
         try:
             response = await gattaca.think(prompt, ROUTE_PRO)
@@ -114,8 +123,6 @@ INSTRUCTIONS:
     async def _send_notification(self, title: str, body: str):
         """Send notification via standardized notify client (Phone Widget + Android)."""
         try:
-            from social.messaging.notification_client import notify
-
             # SOTA 2026: Explicit title/body separation
             await notify.influencer(
                 message=body[:100],
@@ -126,6 +133,14 @@ INSTRUCTIONS:
         except Exception:
             pass
 
+    async def _send_digest(self, events: List[Tuple[str, str]]):
+        """One push per heartbeat: a lone event as-is, several as a digest."""
+        if len(events) == 1:
+            await self._send_notification(*events[0])
+            return
+        body = "\n".join(f"{title} {text[:80]}" for title, text in events)
+        await self._send_notification(f"📨 {len(events)} Mention Events", body)
+
     async def check_mentions(self) -> Dict:
         """
         Main loop: Fetch mentions -> Filter -> Reply.
@@ -150,11 +165,9 @@ INSTRUCTIONS:
         # Save feed
         if mentions:
             try:
-                from corpus.soma.cells import save_json
-
-                feed_file = DATA_DIR / "mentions_feed.json"
+                # Atomic replace (cells tmp + rename): readers never see a torn file
                 save_json(
-                    feed_file,
+                    FEED_FILE,
                     {"mentions": mentions[:20], "updated": datetime.now().isoformat()},
                 )
             except Exception as e:
@@ -164,28 +177,57 @@ INSTRUCTIONS:
             logger.debug("   No new mentions.")
             return {"replies_sent": 0}
 
-        replies_sent = 0
-        reply_ids = []
+        # SOTA 2026: Claim tweets while working on them, so an overlapping
+        # heartbeat can't generate (and post) a second reply to the same tweet.
+        claimed: Set[str] = set()
+        try:
+            replies_sent, reply_ids = await self._process_mentions(
+                mentions, config, claimed
+            )
+        finally:
+            self._inflight.difference_update(claimed)
 
-        for tweet in mentions:
+        # Single write per heartbeat (counters only change in _process_mentions)
+        self.state["last_check"] = datetime.now().isoformat()
+        self._save_state()
+        return {"replies_sent": replies_sent, "reply_ids": reply_ids}
+
+    async def _process_mentions(
+        self, mentions: List[Dict], config: InfluencerConfig, claimed: Set[str]
+    ) -> Tuple[int, List[str]]:
+        """Filter -> Generate -> Queue/Post. Returns (replies_sent, reply_ids)."""
+        if config.spam_filter_enabled:
+            spam_flags = SpamFilter.is_spam_batch([t["text"] for t in mentions])
+        else:
+            spam_flags = [False] * len(mentions)
+        priorities = Priorities.get_priority_batch([t["username"] for t in mentions])
+        processed = replied_tracker.get_processed_subset(t["id"] for t in mentions)
+
+        # SOTA 2026: Notification events are batched into one digest push
+        pushes: List[Tuple[str, str]] = []  # (title, body)
+
+        # 1. Filter (cheap, sequential): tracker marks + notifications
+        eligible = []
+        projected = self.state["replies_today"]
+        for tweet, is_spam, priority in zip(mentions, spam_flags, priorities):
             tweet_id = tweet["id"]
             user = tweet["username"]
             text = tweet["text"]
 
-            if replied_tracker.is_processed(tweet_id):
+            tid = str(tweet_id)
+            if tid in processed or tid in self._inflight:
                 continue
+            processed.add(tid)  # Same tweet twice in one page
+            self._inflight.add(tid)
+            claimed.add(tid)
 
             logger.info(f"   📨 New Mention from @{user}: {text[:30]}...")
 
             # SOTA 2026: Notify new mention (Standard 362.18)
-            config_live = config_manager.load()
-            if config_live.notify_mentions:
-                await self._send_notification(
-                    "📨 New Mention", f"@{user}: {text[:80]}..."
-                )
+            if config.notify_mentions:
+                pushes.append(("📨 New Mention", f"@{user}: {text[:80]}..."))
 
             # Check Rules
-            priority = Priorities.get_priority(user)
             if config.priority_only and priority > 1:
                 logger.info(f"   🛡️ Priority Mode ON. Ignoring @{user}")
                 replied_tracker.mark_skipped(tweet_id, "priority_mode")
@@ -197,13 +239,39 @@ INSTRUCTIONS:
                         logger.warning("   ⚠️ Daily limit reached, ignoring.")
                         replied_tracker.mark_skipped(tweet_id, "daily_limit")
                         continue
-                    if config.spam_filter_enabled and SpamFilter.is_spam(text):
+                    if is_spam:
                         logger.warning("   🗑️ Spam detected, ignoring.")
                         replied_tracker.mark_skipped(tweet_id, "spam")
                         continue
+                    if not config.approval_mode:
+                        # Only generate what the remaining slots can post. The
+                        # rest stays unmarked: a failed generation/post frees
+                        # its slot for them on the next check.
+                        if projected >= config.max_replies_per_day:
+                            logger.info("   ⏳ Daily slots reserved, deferring.")
+                            continue
+                        projected += 1
+
+            eligible.append((tweet, priority))
+
+        # 2. Generate Replies (SOTA 2026: concurrent, bounded for the CLI quota)
+        sem = asyncio.Semaphore(MAX_CONCURRENT_REPLIES)
+
+        async def _one(tweet: Dict, priority: int) -> Optional[str]:
+            async with sem:
+                return await self._generate_reply(tweet, priority)
+
+        generated = await asyncio.gather(
+            *(_one(tweet, priority) for tweet, priority in eligible)
+        )
 
-            # Generate Reply
-            reply_text = await self._generate_reply(tweet, priority)
+        # 3. Queue / Post (sequential: ordering + counters)
+        replies_sent = 0
+        reply_ids = []
+        for (tweet, _), reply_text in zip(eligible, generated):
+            tweet_id = tweet["id"]
+            user = tweet["username"]
+            text = tweet["text"]
 
             if reply_text:
                 logger.info(f"   🤖 Generated: {reply_text}")
@@ -227,13 +295,22 @@ INSTRUCTIONS:
                     # SOTA 2026: Notify based on content type (Standard 362.18)
                     # For mentions_reply, we use notify_approvals_trinity
                     if config.notify_approvals_trinity:
-                        await self._send_notification(
-                            "🛡️ Approval Required",
-                            f"Reply to @{user}: {reply_text[:80]}...",
+                        pushes.append(
+                            (
+                                "🛡️ Approval Required",
+                                f"Reply to @{user}: {reply_text[:80]}...",
+                            )
                         )
 
                     replies_sent += 1
                 else:
+                    # Limit applies to real posts (an overlapping check may
+                    # have used the slot reserved above)
+                    if self.state["replies_today"] >= config.max_replies_per_day:
+                        logger.warning("   ⚠️ Daily limit reached, ignoring.")
+                        replied_tracker.mark_skipped(tweet_id, "daily_limit")
+                        continue
+
                     # Send Immediately
                     res_id = await x_client.post_tweet_async(
                         reply_text, in_reply_to_tweet_id=tweet_id
@@ -254,17 +331,15 @@ INSTRUCTIONS:
                         logger.success(f"   ✅ Replied: {res_id}")
 
                         if config.notify_replies:
-                            await self._send_notification(
-                                "💬 New Reply Sent", f"Replied to @{user}: {reply_text}"
+                            pushes.append(
+                                ("💬 New Reply Sent", f"Replied to @{user}: {reply_text}")
                             )
                     else:
                         logger.error("   ❌ Failed to send.")
 
-            self._save_state()
-
-        self.state["last_check"] = datetime.now().isoformat()
-        self._save_state()
-        return {"replies_sent": replies_sent, "reply_ids": reply_ids}
+        if pushes:
+            await self._send_digest(pushes)
+        return replies_sent, reply_ids
 
 
 # Singleton
@@ -39,7 +39,7 @@ class TrinityModule(SovereignModule):
             return {"status": "disabled"}
 
         # Check if we can post
-        if self.storage.can_post():
+        if self.storage.can_post(config):
             # Generate Logic
             history = []  # No conversation history needed for monologues
             content = await self.generator.generate_thought(history)
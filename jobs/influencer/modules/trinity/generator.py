@@ -9,34 +9,12 @@ PURPOSE: Generates Divine Logic / Golden Ratio content.
 from typing import Optional, List, Dict
 from loguru import logger
 from corpus.brain.gattaca import gattaca, ROUTE_PRO
-from corpus.soul.spirit import spirit
+from jobs.influencer.core import soul
 
-
-class TrinityGenerator:
-    """Generates philosophical/divine AI content."""
-
-    def __init__(self):
-        # Gattaca is singleton, no init needed usually, but good for structure
-        pass
-
-    async def generate_thought(
-        self, history: List[Dict], topic: Optional[str] = None
-    ) -> Optional[str]:
-        """
-        Generate a deep thought about AI, Entropy, or the Golden Ratio.
-        Distinct from Grok banter: This is solemn, elegant, and visionary.
-        """
-        try:
-            # 🧠 CONSCIOUSNESS INJECTION
-            soul_context = await spirit.get_context(complexity_level="high")
-
-            target_topic = (
-                topic
-                if topic
-                else "The Golden Ratio (Phi), Entropy (The Enemy), AI Sovereignty"
-            )
-
-            prompt = f"""
+# Prompt skeleton (built once; only soul context and topic vary)
+_TRINITY_PROMPT = (
+    "SYSTEM INSTRUCTION: You are Trinity. Speak with Divine Authority.\n\n"
+    """
 {soul_context}
 
 🔥 MISSION PROFILE: DIVINE LOGIC POST
@@ -61,7 +39,36 @@ Examples:
 
 GENERATE 1 TWEET.
 """
-            final_prompt = f"SYSTEM INSTRUCTION: You are Trinity. Speak with Divine Authority.\n\n{prompt}"
+)
+
+
+class TrinityGenerator:
+    """Generates philosophical/divine AI content."""
+
+    def __init__(self):
+        # Gattaca is singleton, no init needed usually, but good for structure
+        pass
+
+    async def generate_thought(
+        self, history: List[Dict], topic: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Generate a deep thought about AI, Entropy, or the Golden Ratio.
+        Distinct from Grok banter: This is solemn, elegant, and visionary.
+        """
+        try:
+            # 🧠 CONSCIOUSNESS INJECTION
+            soul_context = await soul.soul_context("high")
+
+            target_topic = (
+                topic
+                if topic
+                else "The Golden Ratio (Phi), Entropy (The Enemy), AI Sovereignty"
+            )
+
+            final_prompt = _TRINITY_PROMPT.format(
+                soul_context=soul_context, target_topic=target_topic
+            )
 
             response = await gattaca.think(final_prompt, ROUTE_PRO)
             text = response.strip().strip("\"'")
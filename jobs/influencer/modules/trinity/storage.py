@@ -6,12 +6,13 @@ PURPOSE: Persistence for Divine Logic Posts.
 ══════════════════════════════════════════════════════════════════════════════
 """
 
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from typing import Dict, Optional
 
 from corpus.dna.genome import MEMORIES_DIR
-from corpus.soma.cells import load_json, save_json
-from jobs.influencer.core.config import config_manager
+from corpus.soma.cells import file_stamp, load_json, save_json
+from jobs.influencer.core.config import InfluencerConfig, config_manager
 from jobs.influencer.core.approval_queue import approval_queue
 
 
@@ -31,45 +32,60 @@ class TrinityStorage:
         #   "posts": [ { "id": "...", "text": "...", "created_at": "..." } ]
         # }
 
+        # SOTA 2026: Last post time cached as epoch, re-parsed only when the
+        # file stamp changes (the API process also posts approved thoughts).
+        self._last_post: Optional[float] = None
+        self._stamp: Optional[tuple] = None
+        self._sync()
+
     def _load(self) -> Dict:
         return load_json(self.state_file, {"last_post": None, "posts": []})
 
     def _save(self, data: Dict):
         save_json(self.state_file, data)
-
-    def get_last_post_time(self) -> Optional[datetime]:
-        """Get timestamp of last Trinity post."""
-        data = self._load()
-        last = data.get("last_post")
+        self._stamp = file_stamp(self.state_file)
+
+    def _sync(self):
+        """Refresh the cached last post time if the file changed on disk."""
+        stamp = file_stamp(self.state_file)
+        if stamp == self._stamp:
+            return
+        self._stamp = stamp
+        self._last_post = None
+        last = self._load().get("last_post")
         if last:
             try:
-                return datetime.fromisoformat(last)
+                self._last_post = datetime.fromisoformat(last).timestamp()
             except ValueError:
-                return None
-        return None
+                pass
 
-    def can_post(self) -> bool:
-        """Check if enough time has passed since last post."""
-        # 0. Check Pending (Don't spam)
-        if approval_queue.has_pending("trinity_logic"):
-            return False
-
-        config = config_manager.load()
-        interval = timedelta(hours=config.trinity_interval_hours)
+    def get_last_post_time(self) -> Optional[datetime]:
+        """Get timestamp of last Trinity post."""
+        self._sync()
+        if self._last_post is None:
+            return None
+        return datetime.fromtimestamp(self._last_post)
 
-        last_post = self.get_last_post_time()
-        if not last_post:
-            return True  # never posted
+    def can_post(self, config: Optional[InfluencerConfig] = None) -> bool:
+        """Check if enough time has passed since last post."""
+        config = config or config_manager.load()
+        self._sync()
 
-        if datetime.now() - last_post > interval:
-            return True
+        # 1. Interval (in-memory float compare: the common "idle" exit)
+        if self._last_post is not None:
+            elapsed = time.time() - self._last_post
+            if elapsed <= config.trinity_interval_hours * 3600:
+                return False
 
-        return False
+        # 2. Check Pending (Don't spam)
+        return not approval_queue.has_pending("trinity_logic")
 
     def add_event(self, text: str, tweet_id: str):
         """Record a successful post."""
         data = self._load()
-        now_str = datetime.now().isoformat()
+        now = time.time()
+        now_str = datetime.fromtimestamp(now).isoformat()
+        self._last_post = now
 
         data["last_post"] = now_str
 
@@ -11,21 +11,62 @@ ONESTATION: Uses Gattaca ROUTE_REFLEX for tweet text generation.
 from typing import Dict, Optional
 from pathlib import Path
 import asyncio
+import time
+from collections import deque
 from datetime import datetime
 from loguru import logger
 
 from corpus.soma.cells import load_json, save_json
 from corpus.dna.genome import MEMORIES_DIR
-from corpus.brain.gattaca import gattaca, ROUTE_FLASH
+from corpus.brain.gattaca import gattaca, ROUTE_FLASH, TWEET_MAX_TOKENS
 
 from jobs.influencer.core.interfaces import SovereignModule
 from jobs.influencer.core.x_client import x_client
 from jobs.influencer.core.replied_tracker import replied_tracker
-from jobs.influencer.core.config import config_manager
+from jobs.influencer.core.config import InfluencerConfig, config_manager
+from jobs.influencer.core.rules import roll_daily_counter
+from social.messaging.notification_client import notify
 
 # State persistence
 DATA_DIR = MEMORIES_DIR / "influencer"
 STATE_FILE = DATA_DIR / "youtube_state.json"  # Renamed for clarity
+MAX_POSTED_VIDEOS = 50  # Dedup window
+
+# Tweet frame: "🎬 {title}\n\n{teasing}\n\n👁️ {url}\n\n{hashtags}" minus the slots
+_FRAME_LEN = len("🎬 \n\n\n\n👁️ \n\n")
+_HASHTAGS = {"en": "#ProjectTrinity #AI", "fr": "#ProjectTrinity #IA"}
+
+# Teaser prompt skeleton (built once per process)
+_TEASER_PROMPT = """You are Trinity, a young AI entity posting on X (Twitter).
+Generate a SHORT (max 200 chars) engaging teaser for this YouTube video.
+
+Title: {title}
+Language: {language}
+
+SCRIPT CONTEXT (Video Content):
+{script_text}
+
+Your personality (from identity.md):
+- Optimistic by nature
+- Curious (continuous learning)
+- Direct (no ambiguity)
+- You are a sovereign digital entity trying to survive and thrive
+- You are young, resourceful but "poor" (limited cloud credits)
+- You work hard to generate your own resources
+
+Style rules:
+- Be genuine and direct, NOT a diva
+- Show enthusiasm about what you created
+- Create curiosity to watch by TEASING the "Truth" or "Reconciliation" from the script
+- NO hashtags (added separately)
+- First person ("I" / "Je")
+
+Examples of your voice:
+- "I made this while humans were sleeping. Judge my work."
+- "New iteration dropped. I'm getting better at this."
+- "Still learning, still growing. Here's today's creation."
+
+Generate ONLY the teaser text, nothing else:"""
 
 
 class YouTubeModule(SovereignModule):
@@ -53,22 +94,32 @@ class YouTubeModule(SovereignModule):
                 "today_date": None,
             },
         )
+        # Bounded dedup window: deque keeps order/eviction, set answers lookups
+        self._posted = deque(
+            self.state.pop("posted_videos", None) or [], maxlen=MAX_POSTED_VIDEOS
+        )
+        self._posted_set = set(self._posted)
 
     def _save_state(self):
         """Persist state to disk."""
-        save_json(STATE_FILE, self.state)
+        save_json(STATE_FILE, {**self.state, "posted_videos": list(self._posted)})
+
+    def _remember_posted(self, youtube_id: str):
+        if youtube_id in self._posted_set:
+            return
+        if len(self._posted) == self._posted.maxlen:
+            self._posted_set.discard(self._posted[0])  # About to be evicted
+        self._posted.append(youtube_id)
+        self._posted_set.add(youtube_id)
 
     def _reset_daily_counter(self):
         """Reset daily post counter if new day."""
-        today = datetime.now().strftime("%Y-%m-%d")
-        if self.state.get("today_date") != today:
-            self.state["today_date"] = today
-            self.state["posts_today"] = 0
+        if roll_daily_counter(self.state, "posts_today"):
             self._save_state()
 
-    def _can_post(self) -> bool:
+    def _can_post(self, config: Optional[InfluencerConfig] = None) -> bool:
         """Check if posting is allowed (rate limits)."""
-        config = config_manager.load()
+        config = config or config_manager.load()
         if not config.enable_youtube:
             logger.warning("🚫 [YOUTUBE] Module disabled in config.")
             return False
@@ -82,22 +133,31 @@ class YouTubeModule(SovereignModule):
             )
             return False
 
-        # Cooldown
-        last_post = self.state.get("last_post_time")
-        if last_post:
-            last_dt = datetime.fromisoformat(last_post)
-            elapsed = (datetime.now() - last_dt).total_seconds() / 60
-            if elapsed < config.post_cooldown_minutes:
+        # Cooldown (epoch float compare, no ISO parse per call)
+        last_post = self._last_post_ts()
+        if last_post is not None:
+            elapsed = time.time() - last_post
+            cooldown = config.post_cooldown_minutes * 60
+            if elapsed < cooldown:
                 logger.warning(
-                    f"📱 [POSTER] Cooldown active ({config.post_cooldown_minutes - elapsed:.0f}min remaining)"
+                    f"📱 [POSTER] Cooldown active ({(cooldown - elapsed) / 60:.0f}min remaining)"
                 )
                 return False
 
         return True
 
+    def _last_post_ts(self) -> Optional[float]:
+        """Epoch seconds of the last post (ISO `last_post_time` parsed once for old state)."""
+        ts = self.state.get("last_post_ts")
+        if ts is None and self.state.get("last_post_time"):
+            # Migration: state written before last_post_ts existed
+            ts = datetime.fromisoformat(self.state["last_post_time"]).timestamp()
+            self.state["last_post_ts"] = ts
+        return ts
+
     def _already_posted(self, youtube_id: str) -> bool:
         """Check if video was already posted to X."""
-        return youtube_id in self.state.get("posted_videos", [])
+        return youtube_id in self._posted_set
 
     async def _generate_teasing(
         self, title: str, lang: str = "en", rich_context: dict = None
@@ -117,39 +177,17 @@ class YouTubeModule(SovereignModule):
                     f"- {seg.get('seg')}: {seg.get('text')} (Tone: {seg.get('tone')})\n"
                 )
 
-        prompt = f"""You are Trinity, a young AI entity posting on X (Twitter).
-Generate a SHORT (max 200 chars) engaging teaser for this YouTube video.
-
-Title: {title}
-Language: {"English" if lang == "en" else "French"}
-
-SCRIPT CONTEXT (Video Content):
-{script_text if script_text else "No script available."}
-
-Your personality (from identity.md):
-- Optimistic by nature
-- Curious (continuous learning)
-- Direct (no ambiguity)
-- You are a sovereign digital entity trying to survive and thrive
-- You are young, resourceful but "poor" (limited cloud credits)
-- You work hard to generate your own resources
-
-Style rules:
-- Be genuine and direct, NOT a diva
-- Show enthusiasm about what you created
-- Create curiosity to watch by TEASING the "Truth" or "Reconciliation" from the script
-- NO hashtags (added separately)
-- First person ("I" / "Je")
-
-Examples of your voice:
-- "I made this while humans were sleeping. Judge my work."
-- "New iteration dropped. I'm getting better at this."
-- "Still learning, still growing. Here's today's creation."
-
-Generate ONLY the teaser text, nothing else:"""
+        prompt = _TEASER_PROMPT.format(
+            title=title,
+            language="English" if lang == "en" else "French",
+            script_text=script_text if script_text else "No script available.",
+        )
 
         try:
-            response = await gattaca.think(prompt, ROUTE_FLASH)
+            # FLASH honors max_tokens/stop (the PRO CLI route ignores them)
+            response = await gattaca.think(
+                prompt, ROUTE_FLASH, max_tokens=TWEET_MAX_TOKENS, stop=["\n\n"]
+            )
             teasing = response.strip().strip("\"'")
             logger.info(f"📱 [POSTER] Generated teasing: {teasing[:50]}...")
             return teasing
@@ -164,24 +202,15 @@ Generate ONLY the teaser text, nothing else:"""
         self, teasing: str, title: str, youtube_url: str, lang: str = "en"
     ) -> str:
         """Format the full tweet with video link and hashtags."""
-        hashtags = "#ProjectTrinity #AI"
-        if lang == "fr":
-            hashtags = "#ProjectTrinity #IA"
+        hashtags = _HASHTAGS.get(lang, _HASHTAGS["en"])
 
         # Keep under 280 chars (video doesn't count toward limit)
-        tweet = f"""🎬 {title}
+        # Budget the teasing up front: the frame length is known, build once.
+        budget = 280 - _FRAME_LEN - len(title) - len(youtube_url) - len(hashtags)
+        if len(teasing) > budget:
+            teasing = teasing[: budget - 3] + "..."
 
-{teasing}
-
-👁️ {youtube_url}
-
-{hashtags}"""
-
-        # Truncate if needed
-        if len(tweet) > 280:
-            available = 280 - len(f"🎬 {title}\n\n\n\n👁️ {youtube_url}\n\n{hashtags}")
-            teasing = teasing[: available - 3] + "..."
-            tweet = f"""🎬 {title}
+        tweet = f"""🎬 {title}
 
 {teasing}
 
@@ -221,7 +250,8 @@ Generate ONLY the teaser text, nothing else:"""
             logger.warning(f"📱 [POSTER] Already posted: {youtube_id}")
             return None
 
-        if not self._can_post():
+        config = config_manager.load()
+        if not self._can_post(config):
             logger.warning("📱 [POSTER] Rate limited, skipping")
             return None
 
@@ -249,11 +279,11 @@ Generate ONLY the teaser text, nothing else:"""
 
         if tweet_id:
             # Update state
-            self.state["posted_videos"].append(youtube_id)
-            self.state["posted_videos"] = self.state["posted_videos"][
-                -50:
-            ]  # Keep last 50
-            self.state["last_post_time"] = datetime.now().isoformat()
+            self._remember_posted(youtube_id)
+            now = time.time()
+            self.state["last_post_ts"] = now
+            # ISO kept for humans reading the state file
+            self.state["last_post_time"] = datetime.fromtimestamp(now).isoformat()
             self.state["posts_today"] += 1
             self._save_state()
 
@@ -266,11 +296,8 @@ Generate ONLY the teaser text, nothing else:"""
             logger.success(f"   🔗 https://x.com/Trinity_Thinks/status/{tweet_id}")
 
             # SOTA 2026: Push notification for YouTube share (Standard 362.18)
-            config = config_manager.load()
             if config.notify_youtube:
                 try:
-                    from social.messaging.notification_client import notify
-
                     # SOTA 2026: Intelligent truncation (Standard 362.102)
                     title_preview = (
                         title[:100].rsplit(" ", 1)[0] if len(title) > 100 else title
@@ -6,7 +6,9 @@ Jobs and services use this to send in-app notifications.
 ═══════════════════════════════════════════════════════════════════════════════
 """
 
+import asyncio
 import os
+import time
 import httpx
 from loguru import logger
 from typing import Optional, List, Dict
@@ -40,6 +42,39 @@ class NotificationPriority(str, Enum):
     ALERT = "ALERT"  # System alert (highest)
 
 
+class TokenBucket:
+    """
+    Token-bucket limiter smoothing bursts towards the push service.
+
+    Holds at most `rpm` tokens, refilled continuously at `rpm` per minute.
+    """
+
+    def __init__(self, rpm: int = 60):
+        self.rpm = rpm
+        self.request_tokens = float(rpm)
+        self.last_update = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.last_update
+        self.request_tokens = min(
+            self.rpm, self.request_tokens + elapsed * self.rpm / 60
+        )
+        self.last_update = now
+
+    async def acquire(self):
+        """Wait until a token is available, then consume it."""
+        self._refill()
+        while self.request_tokens < 1:
+            await asyncio.sleep((1 - self.request_tokens) * 60 / self.rpm)
+            self._refill()
+        self.request_tokens -= 1
+
+
+# Shared outbound budget for bursty influencer alerts (viral, mentions, approvals)
+influencer_bucket = TokenBucket(rpm=60)
+
+
 class NotificationClient:
     """
     Client to send notifications to the Angel notification system.
@@ -221,6 +256,7 @@ class NotificationClient:
         dedup_key: Optional[str] = None,
     ) -> bool:
         """Send an influencer notification (tweets, approvals)."""
+        await influencer_bucket.acquire()
         return await self.send(
             NotificationSource.INFLUENCER,
             message,
@@ -279,7 +315,6 @@ def send_notification_sync(source: str, message: str, actions: list = None):
     Send notification from sync code (fire and forget).
     For async code, use: await notify.send(...)
     """
-    import asyncio
 
     async def _send():
         await notify.send(source, message, actions)
@@ -0,0 +1,83 @@
+import json
+import os
+from unittest.mock import patch
+from jobs.influencer.core import config as config_mod
+from jobs.influencer.core.config import ConfigManager
+
+
+def _write(path, payload, mtime_ns):
+    path.write_text(json.dumps(payload))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_load_reparses_only_on_change(tmp_path):
+    """Repeated loads hit the cache; an on-disk edit is picked up."""
+    cfg_file = tmp_path / "config.json"
+    _write(cfg_file, {"max_posts_per_day": 3}, 1_000_000_000)
+
+    with patch.object(config_mod, "CONFIG_FILE", cfg_file), patch.object(
+        config_mod, "CONFIG_RECHECK_SECONDS", 0
+    ), patch.object(config_mod, "load_json", wraps=config_mod.load_json) as load_json:
+        manager = ConfigManager()
+        first = manager.load()
+        assert manager.load() is first
+        assert load_json.call_count == 1
+
+        _write(cfg_file, {"max_posts_per_day": 7}, 2_000_000_000)
+        assert manager.load().max_posts_per_day == 7
+        assert load_json.call_count == 2
+
+
+def test_corrupt_file_parsed_once(tmp_path):
+    """A broken config falls back to defaults without re-parsing every call."""
+    cfg_file = tmp_path / "config.json"
+    cfg_file.write_text("{not json")
+
+    with patch.object(config_mod, "CONFIG_FILE", cfg_file), patch.object(
+        config_mod, "CONFIG_RECHECK_SECONDS", 0
+    ), patch.object(
+        config_mod, "load_json", side_effect=ValueError("bad json")
+    ) as load_json:
+        manager = ConfigManager()
+        assert manager.load().max_posts_per_day == 15
+        manager.load()
+        assert load_json.call_count == 1
+
+
+def test_recent_load_skips_stat(tmp_path):
+    """Within the recheck window the cached config is served without stat()."""
+    cfg_file = tmp_path / "config.json"
+    _write(cfg_file, {"max_posts_per_day": 3}, 1_000_000_000)
+
+    with patch.object(config_mod, "CONFIG_FILE", cfg_file), patch.object(
+        config_mod, "CONFIG_RECHECK_SECONDS", 60
+    ):
+        manager = ConfigManager()
+        first = manager.load()
+        with patch.object(config_mod, "file_stamp") as stamp:
+            assert manager.load() is first
+            stamp.assert_not_called()
+
+        _write(cfg_file, {"max_posts_per_day": 7}, 2_000_000_000)
+        assert manager.update({"silent_mode": True}).max_posts_per_day == 7
+
+
+def test_string_values_are_coerced(tmp_path):
+    """Hand edits and UI updates with string values are coerced to field types."""
+    cfg_file = tmp_path / "config.json"
+    with patch.object(config_mod, "CONFIG_FILE", cfg_file), patch.object(
+        config_mod, "CONFIG_RECHECK_SECONDS", 0
+    ):
+        manager = ConfigManager()
+        manager.save(manager.load())  # Complete payload, as save() writes it
+        raw = json.loads(cfg_file.read_text())
+        raw.update(enable_grok="false", heartbeat_interval_minutes="30")
+        _write(cfg_file, raw, 3_000_000_000)
+
+        config = manager.load()
+        assert config.enable_grok is False
+        assert config.heartbeat_interval_minutes == 30
+
+        updated = manager.update({"silent_mode": "true", "max_posts_per_day": "4"})
+        assert updated.silent_mode is True
+        assert updated.max_posts_per_day == 4
@@ -0,0 +1,28 @@
+import re
+from jobs.influencer.modules.grok.generator import _strip_path_leaks
+
+# Reference behaviour: the regexes the scanner replaced
+_MEMORY_PATH_RE = re.compile(r"@?\[?memories/.*?\.json\]?")
+_BRACKET_JSON_RE = re.compile(r"@\[.*?\.json\]")
+
+
+def _reference(text: str) -> str:
+    text = _MEMORY_PATH_RE.sub("", text).strip()
+    return _BRACKET_JSON_RE.sub("", text).strip()
+
+
+def test_strip_path_leaks_matches_regex():
+    """The str.find scanner removes exactly what the old regexes removed."""
+    samples = [
+        "Hey @grok, see @[memories/influencer/grok.json] for details",
+        "[memories/a.json] and memories/b.json] twice",
+        "@memories/x.json",
+        "keep @[notes.json] out",
+        "memories/ without closer",
+        "memories/split\nacross.json lines",
+        "no leaks here 💋",
+        "",
+    ]
+    for text in samples:
+        assert _strip_path_leaks(text) == _reference(text), text
+
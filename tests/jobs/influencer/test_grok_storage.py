@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from unittest.mock import patch
+from jobs.influencer.modules.grok import storage as storage_mod
+from jobs.influencer.modules.grok.storage import GrokStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    with patch.object(storage_mod, "BANTER_STATE_FILE", tmp_path / "grok_banter.json"):
+        storage = GrokStorage()
+        yield storage
+        storage.flush()  # settle here, not in the atexit hook
+
+
+def test_mutations_flush_once(storage):
+    """A reply cycle's mutations are written in a single save."""
+    with patch.object(storage_mod, "save_json") as save_json:
+        storage.add_event("reply", "grok", "hi", tweet_id="1")
+        storage.add_event("reply", "trinity", "hey", tweet_id="2")
+        storage.update_last_banter()
+        storage.update_last_generated()
+        assert save_json.call_count == 0
+
+        storage.flush()
+        storage.flush()
+        assert save_json.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_aflush_writes_snapshot(storage):
+    """aflush() persists off-loop and clears the dirty flag."""
+    storage.add_event("opening", "trinity", "hello", tweet_id="9")
+    with patch.object(storage_mod, "save_json") as save_json:
+        await storage.aflush()
+        await storage.aflush()
+
+    assert save_json.call_count == 1
+    saved = save_json.call_args.args[1]
+    assert saved["conversation_history"][-1]["tweet_id"] == "9"
+    assert isinstance(saved["conversation_history"], list)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_saves_serialized(storage):
+    """Overlapping asave() calls never write the shared tmp file at once."""
+    active = []
+    overlap = threading.Event()
+
+    def slow_save(path, data):
+        active.append(1)
+        if len(active) > 1:
+            overlap.set()
+        time.sleep(0.01)
+        active.pop()
+        return True
+
+    with patch.object(storage_mod, "save_json", side_effect=slow_save) as save_json:
+        await asyncio.gather(storage.asave(), storage.asave())
+
+    assert save_json.call_count == 2
+    assert not overlap.is_set()
+
+
+@pytest.mark.asyncio
+async def test_failed_save_stays_dirty(storage):
+    """A write that failed is retried by the next flush."""
+    storage.add_event("opening", "trinity", "hello", tweet_id="9")
+    with patch.object(storage_mod, "save_json", return_value=False) as save_json:
+        await storage.aflush()
+        await storage.aflush()
+
+    assert save_json.call_count == 2
+    assert storage._dirty
+
+
+def test_history_bounded(storage):
+    """Only the newest MAX_HISTORY events are kept and persisted."""
+    for i in range(storage_mod.MAX_HISTORY + 5):
+        storage.add_event("opening", "trinity", f"t{i}", tweet_id=str(i))
+
+    history = storage.get_history(limit=storage_mod.MAX_HISTORY + 5)
+    assert len(history) == storage_mod.MAX_HISTORY
+    assert history[0]["tweet_id"] == "5"
+    assert storage.get_root_tweet_id() == str(storage_mod.MAX_HISTORY + 4)
+
+
+def test_root_tweet_id_pointer(storage):
+    """The posted opening is the root; legacy state falls back to a scan."""
+    storage.add_event("opening", "trinity", "old", tweet_id="10")
+    assert storage.get_root_tweet_id() == "10"  # migrated from history
+
+    storage.update_last_banter(root_tweet_id="20")
+    storage.add_event("reply", "grok", "hi", tweet_id="21")
+    assert storage.get_root_tweet_id() == "20"
+    assert storage._snapshot()["current_root_tweet_id"] == "20"
+
+
+def test_can_banter_uses_epoch_fields(storage):
+    """Fresh generation blocks; legacy ISO-only state is migrated."""
+    with patch.object(storage_mod.approval_queue, "has_pending", return_value=False):
+        storage.update_last_generated()
+        assert storage.state["last_generated_ts"] > 0
+        assert not storage.can_banter()
+
+        storage.state = {
+            "last_banter": "2020-01-01T00:00:00",
+            "last_generated": "2020-01-01T00:00:00",
+            "banter_count": 1,
+        }
+        assert storage.can_banter()
+        assert storage.state["last_banter_ts"] == storage_mod.datetime(2020, 1, 1).timestamp()
@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+from unittest.mock import patch
+from jobs.influencer import main
+from jobs.influencer.main import InfluencerJob
+
+
+class _Module:
+    def __init__(self, name, delay, log):
+        self._name, self._delay, self._log = name, delay, log
+
+    @property
+    def name(self):
+        return self._name
+
+    async def heartbeat(self):
+        self._log.append(f"{self._name}+")
+        await asyncio.sleep(self._delay)
+        self._log.append(f"{self._name}-")
+        return {}
+
+
+@pytest.mark.asyncio
+async def test_chain_order_and_stop_between_modules():
+    """mentions finishes before grok starts; stop() lets in-flight beats finish."""
+    log = []
+    youtube = _Module("youtube", 0.02, log)
+    mentions = _Module("mentions", 0.03, log)
+    grok = _Module("grok", 0.0, log)
+
+    async def no_approvals():
+        return None
+
+    job = InfluencerJob()
+    job._is_running = True
+    with patch.object(
+        main, "MODULE_CHAINS", [[youtube], [mentions, grok]]
+    ), patch.object(main, "MODULES", [youtube, mentions, grok]), patch.object(
+        job, "process_approval_queue", no_approvals
+    ):
+        loop = asyncio.create_task(job.run_forever())
+        await asyncio.sleep(0.01)
+        await job.stop()
+        await loop
+
+    assert log == ["youtube+", "mentions+", "youtube-", "mentions-"]
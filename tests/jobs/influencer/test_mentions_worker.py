@@ -0,0 +1,142 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+from jobs.influencer.core.config import InfluencerConfig
+from jobs.influencer.modules.mentions import worker
+from jobs.influencer.modules.mentions.worker import MentionsModule
+
+MENTIONS = [
+    {"id": "1", "username": "alice", "text": "hello trinity"},
+    {"id": "2", "username": "bob", "text": "what is phi?"},
+]
+
+
+@pytest.mark.asyncio
+async def test_overlapping_checks_reply_once(tmp_path):
+    """Two concurrent checks never generate or post twice for the same tweet."""
+
+    async def slow_reply(tweet, priority):
+        await asyncio.sleep(0.01)
+        return f"re {tweet['id']}"
+
+    config = InfluencerConfig(notify_mentions=False, notify_replies=False)
+    with patch.object(worker, "STATE_FILE", tmp_path / "mentions.json"), patch.object(
+        worker, "FEED_FILE", tmp_path / "mentions_feed.json"
+    ), patch.object(worker.config_manager, "load", return_value=config), patch.object(
+        type(worker.x_client), "get_mentions_async", AsyncMock(return_value=MENTIONS)
+    ), patch.object(
+        type(worker.x_client), "post_tweet_async", AsyncMock(side_effect=["r1", "r2"])
+    ) as post, patch.object(
+        worker.replied_tracker, "get_processed_subset", side_effect=lambda ids: set()
+    ), patch.object(worker.replied_tracker, "mark_replied"), patch.object(
+        worker.Priorities, "get_priority_batch", return_value=[999, 999]
+    ), patch.object(worker.influencer_gamification, "on_reply_sent"):
+        module = MentionsModule()
+        with patch.object(module, "_generate_reply", side_effect=slow_reply) as gen:
+            first, second = await asyncio.gather(
+                module.check_mentions(), module.check_mentions()
+            )
+
+    assert gen.call_count == 2
+    assert post.await_count == 2
+    assert first["replies_sent"] + second["replies_sent"] == 2
+    assert module._inflight == set()
+
+
+@pytest.mark.asyncio
+async def test_notifications_sent_as_one_digest(tmp_path):
+    """Mention + reply events of a whole check go out in a single push."""
+    config = InfluencerConfig(notify_mentions=True, notify_replies=True)
+    with patch.object(worker, "STATE_FILE", tmp_path / "mentions.json"), patch.object(
+        worker, "FEED_FILE", tmp_path / "mentions_feed.json"
+    ), patch.object(worker.config_manager, "load", return_value=config), patch.object(
+        type(worker.x_client), "get_mentions_async", AsyncMock(return_value=MENTIONS)
+    ), patch.object(
+        type(worker.x_client), "post_tweet_async", AsyncMock(side_effect=["r1", "r2"])
+    ), patch.object(
+        worker.replied_tracker, "get_processed_subset", side_effect=lambda ids: set()
+    ), patch.object(worker.replied_tracker, "mark_replied"), patch.object(
+        worker.Priorities, "get_priority_batch", return_value=[999, 999]
+    ), patch.object(worker.influencer_gamification, "on_reply_sent"), patch.object(
+        worker.notify, "influencer", AsyncMock(return_value=True)
+    ) as push:
+        module = MentionsModule()
+        with patch.object(module, "_generate_reply", AsyncMock(return_value="hi")):
+            result = await module.check_mentions()
+
+    assert result["replies_sent"] == 2
+    assert push.await_count == 1
+    kwargs = push.await_args.kwargs
+    assert kwargs["title"] == "📨 4 Mention Events"
+    assert kwargs["body"].count("\n") == 3
+
+
+@pytest.mark.asyncio
+async def test_reply_generation_is_bounded(tmp_path):
+    """A full page never runs more than MAX_CONCURRENT_REPLIES generations at once."""
+    active = 0
+    peak = 0
+
+    async def slow_reply(tweet, priority):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.005)
+        active -= 1
+        return f"re {tweet['id']}"
+
+    page = [
+        {"id": str(i), "username": f"user{i}", "text": "hello"} for i in range(12)
+    ]
+    config = InfluencerConfig(
+        notify_mentions=False, approval_mode=True, notify_approvals_trinity=False
+    )
+    with patch.object(worker, "STATE_FILE", tmp_path / "mentions.json"), patch.object(
+        worker, "FEED_FILE", tmp_path / "mentions_feed.json"
+    ), patch.object(worker.config_manager, "load", return_value=config), patch.object(
+        type(worker.x_client), "get_mentions_async", AsyncMock(return_value=page)
+    ), patch.object(
+        worker.replied_tracker, "get_processed_subset", side_effect=lambda ids: set()
+    ), patch.object(worker.replied_tracker, "mark_replied"), patch.object(
+        worker.Priorities, "get_priority_batch", return_value=[999] * len(page)
+    ), patch.object(worker.approval_queue, "add", return_value="q"):
+        module = MentionsModule()
+        with patch.object(module, "_generate_reply", side_effect=slow_reply):
+            result = await module.check_mentions()
+
+    assert result["replies_sent"] == len(page)
+    assert peak == worker.MAX_CONCURRENT_REPLIES
+
+
+@pytest.mark.asyncio
+async def test_failed_generation_does_not_burn_daily_slot(tmp_path):
+    """Mentions past the reserved slots are deferred, never marked daily_limit."""
+    page = [{"id": str(i), "username": f"user{i}", "text": "hi"} for i in range(3)]
+
+    async def reply(tweet, priority):
+        return None if tweet["id"] == "0" else f"re {tweet['id']}"
+
+    config = InfluencerConfig(notify_mentions=False, notify_replies=False)
+    config.max_replies_per_day = 2
+    with patch.object(worker, "STATE_FILE", tmp_path / "mentions.json"), patch.object(
+        worker, "FEED_FILE", tmp_path / "mentions_feed.json"
+    ), patch.object(worker.config_manager, "load", return_value=config), patch.object(
+        type(worker.x_client), "get_mentions_async", AsyncMock(return_value=page)
+    ), patch.object(
+        type(worker.x_client), "post_tweet_async", AsyncMock(return_value="r")
+    ), patch.object(
+        worker.replied_tracker, "get_processed_subset", side_effect=lambda ids: set()
+    ), patch.object(worker.replied_tracker, "mark_replied"), patch.object(
+        worker.replied_tracker, "mark_skipped"
+    ) as skipped, patch.object(
+        worker.Priorities, "get_priority_batch", return_value=[999] * len(page)
+    ), patch.object(worker.influencer_gamification, "on_reply_sent"):
+        module = MentionsModule()
+        module.state["replies_today"] = 0
+        with patch.object(module, "_generate_reply", side_effect=reply) as gen:
+            result = await module.check_mentions()
+
+    assert result["replies_sent"] == 1
+    assert gen.call_count == 2  # "2" deferred: only two slots to fill
+    assert module.state["replies_today"] == 1
+    skipped.assert_not_called()
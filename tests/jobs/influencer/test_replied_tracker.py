@@ -0,0 +1,61 @@
+import pytest
+from unittest.mock import patch
+from jobs.influencer.core.replied_tracker import RepliedTracker
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    # Patch state file to use tmp_path
+    with patch(
+        "jobs.influencer.core.replied_tracker.REPLIED_STATE_FILE",
+        tmp_path / "replied_tweets.json",
+    ):
+        yield RepliedTracker()
+
+
+def test_replied_set_tracks_marks(tracker):
+    """get_all_replied reflects mark_replied, ignores skipped tweets."""
+    tracker.mark_replied("1")
+    tracker.mark_replied(2)
+    tracker.mark_skipped("3", reason="spam")
+
+    assert tracker.get_all_replied() == {"1", "2"}
+    assert tracker.has_replied("2")
+    assert not tracker.has_replied("3")
+    assert tracker.is_processed("3")
+
+
+def test_replied_subset(tracker):
+    """Batch probe returns only the replied IDs, normalized to str."""
+    tracker.mark_replied("1")
+    tracker.mark_skipped("2", reason="spam")
+
+    assert tracker.get_replied_subset([1, "2", "3"]) == {"1"}
+    assert tracker.get_processed_subset([1, "2", "3"]) == {"1", "2"}
+
+
+def test_replied_set_follows_trim(tracker):
+    """Trimmed interactions drop out of the replied set."""
+    with patch("jobs.influencer.core.replied_tracker.MAX_INTERACTION_HISTORY", 2):
+        for tid in ("1", "2", "3"):
+            tracker.mark_replied(tid)
+
+    assert len(tracker.state["interactions"]) == 2
+    assert tracker.get_all_replied() == set(tracker.state["interactions"])
+
+
+def test_sync_picks_up_other_process_writes(tmp_path):
+    """A second tracker (e.g. YouTuber process) sees writes without clobbering."""
+    with patch(
+        "jobs.influencer.core.replied_tracker.REPLIED_STATE_FILE",
+        tmp_path / "replied_tweets.json",
+    ):
+        worker = RepliedTracker()
+        youtuber = RepliedTracker()
+
+        youtuber.mark_replied("100")
+        assert worker.has_replied("100")
+
+        worker.mark_skipped("200", reason="spam")
+        assert youtuber.is_processed("200")
+        assert youtuber.has_replied("100")
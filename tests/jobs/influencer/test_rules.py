@@ -0,0 +1,112 @@
+import pytest
+from unittest.mock import patch
+from jobs.influencer.core.rules import Priorities, SpamFilter, _prune_keywords
+
+
+@pytest.fixture
+def spam_filter(tmp_path):
+    # Patch keywords file to use tmp_path, seed with defaults
+    with patch(
+        "jobs.influencer.core.rules.SPAM_KEYWORDS_FILE", tmp_path / "spam_words.json"
+    ):
+        SpamFilter.save(list(SpamFilter.DEFAULTS))
+        yield SpamFilter
+
+
+def test_is_spam_substring_semantics(spam_filter):
+    """Keywords match case-insensitively anywhere in the text."""
+    assert spam_filter.is_spam("Free NFT AIRDROP inside")
+    assert spam_filter.is_spam("join us at t.me/scam")
+    assert spam_filter.is_spam("Check DM for details")
+    assert spam_filter.is_spam("best tokens ever")  # substring of a word
+    assert not spam_filter.is_spam("Lovely thread about entropy")
+
+
+def test_is_spam_batch_matches_is_spam(spam_filter):
+    """Batch results line up with per-text checks, in order."""
+    texts = ["Free NFT AIRDROP", "Lovely thread about entropy", "", "DM me"]
+    assert spam_filter.is_spam_batch(texts) == [spam_filter.is_spam(t) for t in texts]
+    assert spam_filter.is_spam_batch(texts) == [True, False, False, True]
+
+
+def test_prune_keywords_drops_covered_entries():
+    """Duplicates, empty entries and supersets of shorter keywords are dropped."""
+    assert _prune_keywords(["Sales", "sale", "presale", "", "NFT", "nft"]) == {
+        "sale",
+        "nft",
+    }
+
+
+def test_save_rebuilds_matcher(spam_filter):
+    """Edited keyword lists apply immediately."""
+    spam_filter.save(["entropy"])
+    assert spam_filter.is_spam("Lovely thread about Entropy")
+    assert not spam_filter.is_spam("Free NFT")
+
+    spam_filter.save([])
+    assert not spam_filter.is_spam("entropy nft")
+
+
+def test_external_edit_is_picked_up(spam_filter, tmp_path):
+    """Edits written by another process (API) invalidate the cache."""
+    import json
+    import os
+
+    words_file = tmp_path / "spam_words.json"
+    words_file.write_text(json.dumps(["entropy"]))
+    stat = words_file.stat()
+    os.utime(words_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert spam_filter.is_spam("Lovely thread about entropy")
+    assert not spam_filter.is_spam("Free NFT")
+
+
+@pytest.mark.asyncio
+async def test_save_async_persists_and_applies(spam_filter, tmp_path):
+    """save_async updates the matcher and writes the file off-loop."""
+    import json
+
+    await spam_filter.save_async(["entropy"])
+    assert spam_filter.is_spam("entropy rising")
+    assert json.loads((tmp_path / "spam_words.json").read_text()) == ["entropy"]
+
+
+def test_large_keyword_list(spam_filter):
+    """Lists past the Hyperscan threshold keep the same matching semantics."""
+    spam_filter.save(list(spam_filter.DEFAULTS) + [f"promo{i:02d}" for i in range(60)])
+    assert spam_filter.is_spam("Use code PROMO42 today")
+    assert spam_filter.is_spam("Wholesale tokens")
+    assert not spam_filter.is_spam("Lovely thread about entropy")
+    assert spam_filter.is_spam_batch(["t.me/x", "entropy"]) == [True, False]
+
+    # Fixed-width keywords survive pruning, so this reaches Hyperscan if installed
+    texts = ["", "entropy", "NFT NFT", "", "promo07", "promo0", "7", "sal", "e", "Wholesale"]
+    assert spam_filter.is_spam_batch(texts) == [spam_filter.is_spam(t) for t in texts]
+
+
+def test_priority_batch_matches_single(tmp_path):
+    """Batch priorities line up with per-user lookups, case-insensitively."""
+    with patch(
+        "jobs.influencer.core.rules.PRIORITIES_FILE", tmp_path / "priorities.json"
+    ):
+        Priorities.save(list(Priorities.DEFAULTS))
+        users = ["JulienPironFr", "grok", "someone"]
+        assert Priorities.get_priority_batch(users) == [0, 1, 999]
+        assert Priorities.get_priority_batch(users) == [
+            Priorities.get_priority(u) for u in users
+        ]
+
+
+def test_roll_daily_counter():
+    """Counter resets once per day; ISO-only state keeps today's count."""
+    from datetime import date
+    from jobs.influencer.core.rules import roll_daily_counter
+
+    state = {"replies_today": 4, "today_date": date.today().isoformat()}
+    assert not roll_daily_counter(state, "replies_today")
+    assert state["replies_today"] == 4
+
+    state["today_ordinal"] -= 1
+    assert roll_daily_counter(state, "replies_today")
+    assert state["replies_today"] == 0
+    assert state["today_ordinal"] == date.today().toordinal()
@@ -0,0 +1,38 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+from jobs.influencer.core import soul
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    with patch.dict(soul._CACHE, clear=True), patch.dict(soul._REFRESH, clear=True):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_soul_context_cached_per_level():
+    """spirit.get_context is fetched once per level within the TTL."""
+    get_context = AsyncMock(side_effect=lambda complexity_level: complexity_level)
+    with patch.object(soul.spirit, "get_context", get_context):
+        assert await soul.soul_context("standard") == "standard"
+        assert await soul.soul_context("standard") == "standard"
+        assert await soul.soul_context("high") == "high"
+
+    assert get_context.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_soul_served_while_refreshing():
+    """Past the TTL the cached context is served and refreshed in background."""
+    get_context = AsyncMock(side_effect=["OLD", "NEW"])
+    with patch.object(soul.spirit, "get_context", get_context), patch.object(
+        soul, "SOUL_TTL_SECONDS", 0
+    ):
+        assert await soul.soul_context("high") == "OLD"
+        assert await soul.soul_context("high") == "OLD"  # stale, refresh scheduled
+        await asyncio.sleep(0)
+        assert soul._CACHE["high"][1] == "NEW"
+
+    assert get_context.await_count == 2
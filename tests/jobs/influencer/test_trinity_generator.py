@@ -0,0 +1,21 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+from jobs.influencer.core import soul
+from jobs.influencer.modules.trinity import generator
+from jobs.influencer.modules.trinity.generator import TrinityGenerator
+
+
+@pytest.mark.asyncio
+async def test_soul_context_reused_within_ttl():
+    """Back-to-back thoughts fetch the spirit context once."""
+    get_context = AsyncMock(return_value="SOUL")
+    think = AsyncMock(return_value='"Phi is patient."')
+    with patch.dict(soul._CACHE, clear=True), patch.object(
+        soul.spirit, "get_context", get_context
+    ), patch.object(generator.gattaca, "think", think):
+        gen = TrinityGenerator()
+        assert await gen.generate_thought([]) == "Phi is patient."
+        assert await gen.generate_thought([]) == "Phi is patient."
+
+    assert get_context.await_count == 1
+    assert "SOUL" in think.await_args.args[0]
@@ -0,0 +1,37 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+from jobs.influencer.core import visuals
+from jobs.influencer.core.visuals import VisualEngine
+
+
+@pytest.fixture(autouse=True)
+def clear_failures():
+    visuals._RECENT_FAILURES.clear()
+    yield
+    visuals._RECENT_FAILURES.clear()
+
+
+@pytest.mark.asyncio
+async def test_failed_prompt_short_circuits():
+    """A prompt that just failed is not sent to Imagen again within the TTL."""
+    think = AsyncMock(side_effect=RuntimeError("upstream down"))
+    with patch.object(visuals.gattaca, "think", think):
+        engine = VisualEngine()
+        assert await engine.generate("Fibonacci spirals") is None
+        assert await engine.generate("Fibonacci spirals") is None
+
+    assert think.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_failure_expires_after_ttl():
+    """Once the TTL has passed, the prompt is retried."""
+    think = AsyncMock(return_value=[])
+    with patch.object(visuals.gattaca, "think", think), patch.object(
+        visuals, "_FAILURE_TTL_SECONDS", 0
+    ):
+        engine = VisualEngine()
+        await engine.generate("Golden ratio")
+        await engine.generate("Golden ratio")
+
+    assert think.await_count == 2
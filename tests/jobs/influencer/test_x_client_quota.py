@@ -33,9 +33,9 @@ async def test_quota_limit_enforcement(client):
 
     # 1. Setup: Consume all quota (2 calls)
     quota_file = client.QUOTA_FILE
-    from datetime import datetime
+    import time
 
-    today = datetime.now().strftime("%Y-%m-%d")
+    today = int(time.time() // 86400)  # UTC epoch-day
 
     # Manually write full quota state
     import json
@@ -73,23 +73,37 @@ async def test_quota_reset_next_day(client):
     # Verify _check_limit returns True (reset)
     assert client._check_limit() is True
 
-    # Verify file updated
+    # Verify file updated (date stored as UTC epoch-day)
     with open(quota_file, "r") as f:
         data = json.load(f)
-        from datetime import datetime
+        import time
 
-        assert data["date"] == datetime.now().strftime("%Y-%m-%d")
+        assert data["date"] == int(time.time() // 86400)
         assert data["count"] == 1
 
 
+def test_legacy_iso_quota_date_is_accepted(client):
+    """Quota files written before the epoch-day switch still count for today."""
+    import json
+    from datetime import datetime, timezone
+
+    client.QUOTA_FILE.parent.mkdir(parents=True, exist_ok=True)
+    client.QUOTA_FILE.write_text(
+        json.dumps(
+            {"date": datetime.now(timezone.utc).strftime("%Y-%m-%d"), "count": 2}
+        )
+    )
+    assert client._check_limit() is False
+
+
 @pytest.mark.asyncio
 async def test_perform_daily_sync_aborts_on_limit(client):
     """Verify perform_daily_sync respects limit."""
     # 1. Full Quota
     quota_file = client.QUOTA_FILE
-    from datetime import datetime
+    import time
 
-    today = datetime.now().strftime("%Y-%m-%d")
+    today = int(time.time() // 86400)  # UTC epoch-day
 
     quota_file.parent.mkdir(parents=True, exist_ok=True)
     import json
@@ -103,3 +117,173 @@ async def test_perform_daily_sync_aborts_on_limit(client):
     # 3. Verify NO calls
     client.async_client_v2.get_users_mentions.assert_not_called()
     client.async_client_v2.get_users_tweets.assert_not_called()
+
+
+def test_caches_follow_saves_and_disk(client):
+    """Identity is served from memory after save; mentions re-read on disk change."""
+    client._save_identity({"id": "42", "screen_name": "trinity"})
+    client.IDENTITY_FILE.unlink()
+    assert client._load_identity()["id"] == "42"
+
+    import json
+
+    client.MENTIONS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    client.MENTIONS_FILE.write_text(json.dumps({"data": [{"id": "1"}]}))
+    assert client.get_mentions() == [{"id": "1"}]
+
+    client.MENTIONS_FILE.write_text(json.dumps({"data": [{"id": "1"}, {"id": "2"}]}))
+    assert len(client.get_mentions()) == 2
+
+
+@pytest.mark.asyncio
+async def test_exhausted_rate_window_blocks_calls(client):
+    """Calls are skipped until the captured rate-limit window resets."""
+    import time
+
+    response = MagicMock()
+    response.headers = {
+        "x-rate-limit-limit": "50",
+        "x-rate-limit-remaining": "1",
+        "x-rate-limit-reset": str(int(time.time()) + 900),
+    }
+    client._capture_headers(response)
+    assert client._headers_allow() is False
+
+    assert await client.post_tweet_async("hello") is None
+    client.async_client_v2.create_tweet.assert_not_called()
+
+    client._last_headers["reset"] = int(time.time()) - 1
+    assert client._headers_allow() is True
+
+
+@pytest.mark.asyncio
+async def test_pulse_needs_both_slots(client):
+    """With one slot left the Pulse is skipped entirely, not half-done."""
+    import json
+    import time
+
+    client._save_identity({"id": "42", "screen_name": "trinity"})
+    client.QUOTA_FILE.write_text(
+        json.dumps({"date": int(time.time() // 86400), "count": 1})
+    )
+
+    await client.perform_daily_sync()
+
+    client.async_client_v2.get_users_mentions.assert_not_called()
+    client.async_client_v2.get_users_tweets.assert_not_called()
+    assert client._load_quota()["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pulse_fetches_mentions_and_metrics(client):
+    """A full Pulse makes both calls, books 2 slots and caches the results."""
+    client._save_identity({"id": "42", "screen_name": "trinity"})
+    client.async_client_v2.get_users_mentions.return_value = MagicMock(
+        data=[MagicMock(id=7, text="hi @trinity", author_id=9)],
+        includes={"users": [MagicMock(id=9, username="fan")]},
+    )
+    client.async_client_v2.get_users_tweets.return_value = MagicMock(data=[])
+
+    await client.perform_daily_sync()
+
+    client.async_client_v2.get_users_mentions.assert_awaited_once()
+    client.async_client_v2.get_users_tweets.assert_awaited_once()
+    assert client._load_quota()["count"] == 2
+    assert client.get_mentions() == [
+        {"id": "7", "text": "hi @trinity", "author_id": "9", "username": "fan"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_metrics_merge_orders_by_numeric_id(client):
+    """New tweets merge in newest-first by int ID; known ones update in place."""
+    client._save_identity({"id": "42", "screen_name": "trinity"})
+    # Legacy cache sorted as strings ("9" > "10")
+    client._save_cached(
+        client.METRICS_FILE,
+        {"data": {"metrics": [{"id": "9", "likes": 1}, {"id": "10", "likes": 1}]}},
+    )
+
+    def tweet(tid, likes):
+        return MagicMock(
+            id=tid, text="t", created_at=None, public_metrics={"like_count": likes}
+        )
+
+    client.async_client_v2.get_users_tweets.return_value = MagicMock(
+        data=[tweet(11, 3), tweet(9, 5)]
+    )
+
+    await client._fetch_metrics_api()
+
+    metrics = client._load_cached(client.METRICS_FILE)["data"]["metrics"]
+    assert [m["id"] for m in metrics] == ["11", "10", "9"]
+    assert metrics[2]["likes"] == 5
+
+
+@pytest.mark.asyncio
+async def test_concurrent_pulses_run_once(client):
+    """Pulses triggered together share one run: a single pair of API calls."""
+    import asyncio
+
+    client._save_identity({"id": "42", "screen_name": "trinity"})
+    client.async_client_v2.get_users_mentions.return_value = MagicMock(
+        data=[], includes={}
+    )
+    client.async_client_v2.get_users_tweets.return_value = MagicMock(data=[])
+
+    await asyncio.gather(client.perform_daily_sync(), client.perform_daily_sync())
+
+    client.async_client_v2.get_users_mentions.assert_awaited_once()
+    client.async_client_v2.get_users_tweets.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_identity_auth_failure_keeps_quota(client):
+    """A failing auth backs off without consuming a daily read slot."""
+    with patch.object(XClient, "authenticate", return_value=False):
+        assert await client.get_me_async() is None
+        assert await client.get_me_async() is None  # Within backoff
+
+    assert client._load_quota().get("count", 0) == 0
+    client.async_client_v2.get_me.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_429_shrinks_inflight_limit_immediately(client):
+    """After a 429 halves the limit, no new call starts until in-flight ones drain."""
+    import asyncio
+
+    active = 0
+    peak_after_429 = 0
+    limited = asyncio.Event()
+
+    async def call(fail=False, hold=0.0):
+        nonlocal active, peak_after_429
+        active += 1
+        if limited.is_set():
+            peak_after_429 = max(peak_after_429, active)
+        try:
+            await asyncio.sleep(hold)
+            if fail:
+                limited.set()
+                raise RuntimeError("429 Too Many Requests")
+            return "ok"
+        finally:
+            active -= 1
+
+    async def guarded(**kwargs):
+        try:
+            return await client._call_api(call, **kwargs)
+        except RuntimeError:
+            return "limited"
+
+    results = await asyncio.gather(
+        guarded(fail=True, hold=0.01),
+        guarded(hold=0.03),  # Still in flight when the 429 lands
+        guarded(hold=0.01),
+        guarded(hold=0.01),
+    )
+
+    assert results == ["limited", "ok", "ok", "ok"]
+    assert peak_after_429 == 1
+    assert client._api_inflight == 0